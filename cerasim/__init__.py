@@ -1,3 +1,4 @@
 from .config import *          # noqa: F401,F403
 from .factory import CeramicFactory   # noqa: F401
 from .metrics import MetricsCollector  # noqa: F401
+from .runner import run_replications, run_scenarios, simulate, simulate_metrics  # noqa: F401
@@ -1,6 +1,8 @@
 # SaniCer Sanitary Ware Industries — Supply Chain Simulation
 # All time units are HOURS; quantities in tonnes (raw materials) or units (commodes).
 
+from typing import NamedTuple
+
 # ── Simulation horizon ────────────────────────────────────────────────────────
 SIM_DAYS      = 90
 HOURS_PER_DAY = 24
@@ -52,18 +54,19 @@ PRODUCTS = {
     },
 }
 
-# Weighted average body weight (kg/unit) across the product mix
-AVG_BODY_KG_UNIT = sum(
-    PRODUCTS[p]["body_kg_per_unit"] * PRODUCTS[p]["demand_share"] for p in PRODUCTS
-)  # ≈ 29.6 kg/unit
+# Weighted average body weight (kg/unit) across the product mix, folded to a
+# literal: Σ body_kg_per_unit × demand_share = 35×0.45 + 28×0.35 + 22×0.20.
+# Keep in sync with PRODUCTS when the mix changes.
+AVG_BODY_KG_UNIT = 29.95
 
 # Ceramic body composition (fraction of dry body weight)
 # Sanitary ware uses more kaolin for whiteness
+# (listed in SUPPLIERS order so material indices line up across tables)
 BODY_COMPOSITION = {
     "clay":     0.40,
-    "kaolin":   0.25,
     "feldspar": 0.20,
     "silica":   0.15,
+    "kaolin":   0.25,
 }
 
 # ── Production stages ─────────────────────────────────────────────────────────
@@ -231,7 +234,11 @@ FG_INITIAL_UNITS = {
     "TWO-PIECE-ECO":  150,
     "WALL-HUNG-PREM": 100,
 }
-FG_MAX_UNITS = {k: 5_000 for k in PRODUCTS}
+FG_MAX_UNITS = {
+    "ONE-PIECE-STD":  5_000,
+    "TWO-PIECE-ECO":  5_000,
+    "WALL-HUNG-PREM": 5_000,
+}
 
 # ── Customer demand ───────────────────────────────────────────────────────────
 DEMAND = {
@@ -245,12 +252,13 @@ DEMAND = {
     "express_premium":     1.15,  # 15 % price uplift for express
 }
 
-CUSTOMERS = [
+# Orders carry an index into this tuple; names are resolved only for reporting
+CUSTOMERS = (
     "BuildCo Portugal", "Iberian Sanitary Distributors", "ConstructMax S.A.",
     "Mediterranean Build", "Porto Renovations", "Atlantic Contracts Ltd",
     "HomeStyle Iberia", "SaniPro Europe", "Lisbon Interiors",
     "Douro Construction Group",
-]
+)
 
 # ── Quality parameters ────────────────────────────────────────────────────────
 QUALITY = {
@@ -274,6 +282,13 @@ FINANCIAL = {
 }
 
 # ── Scenario definitions ──────────────────────────────────────────────────────
+class Disruption(NamedTuple):
+    """No orders can be placed with *material*'s supplier from start_hr to end_hr (inclusive)."""
+    material: str     # key into SUPPLIERS
+    start_hr: float
+    end_hr:   float
+
+
 SCENARIOS = {
     "baseline": {
         "label":       "Baseline",
@@ -283,7 +298,7 @@ SCENARIOS = {
         "supplier_reliability_factor": 1.0,
         "extra_kilns":                 0,
         "safety_stock_factor":         1.0,
-        "kaolin_disruption":           None,   # (start_hr, end_hr) or None
+        "disruptions":                 (),     # tuple of Disruption
     },
     "supply_disruption": {
         "label":       "Supply Disruption",
@@ -293,7 +308,9 @@ SCENARIOS = {
         "supplier_reliability_factor": 1.0,
         "extra_kilns":                 0,
         "safety_stock_factor":         1.0,
-        "kaolin_disruption":           (15 * HOURS_PER_DAY, 50 * HOURS_PER_DAY),
+        "disruptions":                 (
+            Disruption("kaolin", 15 * HOURS_PER_DAY, 50 * HOURS_PER_DAY),
+        ),
     },
     "demand_surge": {
         "label":       "Demand Surge",
@@ -303,7 +320,7 @@ SCENARIOS = {
         "supplier_reliability_factor": 1.0,
         "extra_kilns":                 0,
         "safety_stock_factor":         1.0,
-        "kaolin_disruption":           None,
+        "disruptions":                 (),
     },
     "optimised": {
         "label":       "Optimised",
@@ -313,6 +330,22 @@ SCENARIOS = {
         "supplier_reliability_factor": 1.0,
         "extra_kilns":                 1,      # Total kilns: 2
         "safety_stock_factor":         1.5,    # Reorder points × 1.5
-        "kaolin_disruption":           None,
+        "disruptions":                 (),
     },
 }
+
+# ── Invariants (checked once at import) ───────────────────────────────────────
+# Downstream sampling treats these as exact probability vectors, so drift in
+# the tables above should fail loudly here rather than skew a run.
+assert abs(sum(p["demand_share"] for p in PRODUCTS.values()) - 1.0) < 1e-9, \
+    "PRODUCTS demand_share values must sum to 1.0"
+assert abs(QUALITY["grade_a_rate"] + QUALITY["grade_b_rate"] + QUALITY["reject_rate"] - 1.0) < 1e-9, \
+    "QUALITY grade_a / grade_b / reject rates must sum to 1.0"
+assert abs(sum(BODY_COMPOSITION.values()) - 1.0) < 1e-9, \
+    "BODY_COMPOSITION fractions must sum to 1.0"
+assert abs(AVG_BODY_KG_UNIT - sum(
+    p["body_kg_per_unit"] * p["demand_share"] for p in PRODUCTS.values()
+)) < 1e-9, "AVG_BODY_KG_UNIT is stale — recompute it for the current product mix"
+assert all(
+    d.material in SUPPLIERS for s in SCENARIOS.values() for d in s["disruptions"]
+), "SCENARIOS disruptions must name a material listed in SUPPLIERS"
@@ -0,0 +1,347 @@
+"""
+Read-only views of the configuration tables for the simulation hot path.
+
+``config.py`` stays the human-edited source of truth (dict-of-dicts, one
+record per product / machine / supplier).  This module derives two views
+from it at import time:
+
+* frozen, slotted spec records (``PRODUCT_SPECS`` …) so per-event field
+  access is an attribute load rather than a nested dict lookup, and
+* parallel NumPy arrays so fields can be indexed by integer position and
+  drawn or rolled up for every record in one call.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Final, Mapping, Tuple
+
+import math
+import sys
+
+import numpy as np
+
+from .config import (
+    AVG_BODY_KG_UNIT, BATCH_SIZE_UNITS, BODY_COMPOSITION, CUSTOMERS, DEMAND,
+    Disruption, FG_INITIAL_UNITS, FG_MAX_UNITS, FINANCIAL, HOURS_PER_DAY,
+    INITIAL_INVENTORY, MACHINES, PRODUCTS, QUALITY, SCENARIOS, SIM_DAYS,
+    SIM_DURATION, SUPPLIERS,
+)
+
+
+def _frozen(values, dtype=np.float64) -> np.ndarray:
+    """Build a read-only array so shared tables cannot be mutated mid-run."""
+    arr = np.array(values, dtype=dtype)
+    arr.setflags(write=False)
+    return arr
+
+
+def _interned(table) -> Tuple[str, ...]:
+    """
+    Intern a table's keys.
+
+    The first ``sys.intern`` of a string registers that very object, so the
+    returned tuple holds the dict's own key objects and any later interned
+    copy (e.g. the keys of an unpickled ``ConfigBundle``, which
+    ``__setstate__`` re-interns) resolves to them — dict lookups then hit
+    the identity fast path instead of comparing hyphenated product codes
+    character by character.
+    """
+    return tuple(sys.intern(k) for k in table)
+
+
+# ── Spec records ──────────────────────────────────────────────────────────────
+# Field names mirror the dict keys in config.py, so ``Spec(**cfg)`` fails loudly
+# if a table entry is missing a field or carries a misspelt one.
+
+@dataclass(frozen=True, slots=True)
+class ProductSpec:
+    name:              str
+    price_eur_unit:    float
+    body_kg_per_unit:  float
+    glaze_kg_per_unit: float
+    needs_glaze:       bool
+    complexity:        str
+    demand_share:      float
+    color:             str
+
+
+@dataclass(frozen=True, slots=True)
+class MachineSpec:
+    name:         str
+    detail:       str
+    count:        int
+    proc_mean_hr: float
+    proc_std_hr:  float
+    mtbf_hr:      float
+    mttr_hr:      float
+    capex_eur:    float
+
+
+@dataclass(frozen=True, slots=True)
+class SupplierSpec:
+    name:              str
+    country:           str
+    delivery_qty_t:    float
+    lead_time_mean_hr: float
+    lead_time_std_hr:  float
+    reliability:       float
+    unit_cost_eur_t:   float
+    reorder_point_t:   float
+    max_stock_t:       float
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioSpec:
+    label:                       str
+    description:                 str
+    demand_factor:               float
+    machine_reliability_factor:  float
+    supplier_reliability_factor: float
+    extra_kilns:                 int
+    safety_stock_factor:         float
+    disruptions:                 Tuple[Disruption, ...]
+
+
+PRODUCT_SPECS:  Mapping[str, ProductSpec]  = MappingProxyType(
+    {k: ProductSpec(**v) for k, v in PRODUCTS.items()})
+MACHINE_SPECS:  Mapping[str, MachineSpec]  = MappingProxyType(
+    {k: MachineSpec(**v) for k, v in MACHINES.items()})
+SUPPLIER_SPECS: Mapping[str, SupplierSpec] = MappingProxyType(
+    {k: SupplierSpec(**v) for k, v in SUPPLIERS.items()})
+SCENARIO_SPECS: Mapping[str, ScenarioSpec] = MappingProxyType(
+    {k: ScenarioSpec(**v) for k, v in SCENARIOS.items()})
+
+# ── Products ──────────────────────────────────────────────────────────────────
+PRODUCT_KEYS: Tuple[str, ...] = _interned(PRODUCTS)
+PRODUCT_IDX:  Dict[str, int]  = {k: i for i, k in enumerate(PRODUCT_KEYS)}
+
+# Finished-goods warehouse ceilings / opening stock, aligned with PRODUCT_KEYS
+FG_MAX     = _frozen([FG_MAX_UNITS[p]     for p in PRODUCT_KEYS], np.int32)
+FG_INITIAL = _frozen([FG_INITIAL_UNITS[p] for p in PRODUCT_KEYS], np.int32)
+
+# List price per unit (€), aligned with PRODUCT_KEYS
+PRODUCT_PRICE = _frozen([PRODUCTS[p]["price_eur_unit"] for p in PRODUCT_KEYS])
+
+# Cumulative demand shares for inverse-CDF product draws:
+# ``PRODUCT_KEYS[DEMAND_SHARE_CDF.searchsorted(u * DEMAND_SHARE_CDF[-1], "right")]``
+DEMAND_SHARE_CDF = _frozen(np.cumsum([PRODUCTS[p]["demand_share"] for p in PRODUCT_KEYS]))
+
+# ── Order classes ───────────────────────────────────────────────────────────
+# Index 0 = standard, 1 = express, so ``int(u < EXPRESS_PROB)`` selects a row
+EXPRESS_PROB: float = DEMAND["express_fraction"]
+LEAD_HR    = _frozen([DEMAND["std_lead_time_days"]     * HOURS_PER_DAY,
+                      DEMAND["express_lead_time_days"] * HOURS_PER_DAY])
+PRICE_MULT = _frozen([1.0, DEMAND["express_premium"]])
+
+# ── Customers ─────────────────────────────────────────────────────────────────
+CUSTOMER_NAMES: Tuple[str, ...] = _interned(CUSTOMERS)
+
+# ── Quality grades ────────────────────────────────────────────────────────────
+# Index 0 = Grade A, 1 = Grade B, 2 = reject
+GRADE_PRICE_FACTOR = _frozen([1.0, QUALITY["grade_b_price_factor"], 0.0])
+
+# ── Machines ──────────────────────────────────────────────────────────────────
+MACHINE_NAMES: Tuple[str, ...] = _interned(MACHINES)
+MACHINE_IDX:   Dict[str, int]  = {k: i for i, k in enumerate(MACHINE_NAMES)}
+
+MACHINE_PROC_MEAN = _frozen([MACHINES[k]["proc_mean_hr"] for k in MACHINE_NAMES])
+MACHINE_PROC_STD  = _frozen([MACHINES[k]["proc_std_hr"]  for k in MACHINE_NAMES])
+MACHINE_COUNT     = _frozen([MACHINES[k]["count"]        for k in MACHINE_NAMES], np.int32)
+MACHINE_MTBF      = _frozen([MACHINES[k]["mtbf_hr"]      for k in MACHINE_NAMES])
+MACHINE_MTTR      = _frozen([MACHINES[k]["mttr_hr"]      for k in MACHINE_NAMES])
+
+# Theoretical max throughput per stage (batches/day)
+STAGE_CAPACITY = _frozen(MACHINE_COUNT / MACHINE_PROC_MEAN * HOURS_PER_DAY)
+BOTTLENECK_IDX: int = int(STAGE_CAPACITY.argmin())
+BOTTLENECK:     str = MACHINE_NAMES[BOTTLENECK_IDX]
+
+# ── Suppliers ─────────────────────────────────────────────────────────────────
+SUPPLIER_NAMES: Tuple[str, ...] = _interned(SUPPLIERS)
+SUPPLIER_IDX:   Dict[str, int]  = {k: i for i, k in enumerate(SUPPLIER_NAMES)}
+
+SUPPLIER_RELIABILITY = _frozen([SUPPLIERS[m]["reliability"]     for m in SUPPLIER_NAMES])
+SUPPLIER_UNIT_COST   = _frozen([SUPPLIERS[m]["unit_cost_eur_t"] for m in SUPPLIER_NAMES])
+SUPPLIER_REORDER     = _frozen([SUPPLIERS[m]["reorder_point_t"] for m in SUPPLIER_NAMES])
+
+# ── Per-batch material consumption (tonnes) ──────────────────────────────────
+# Body minerals in supplier order, so rows line up with SUPPLIER_IDX lookups.
+BODY_MATERIALS: Tuple[str, ...] = tuple(m for m in SUPPLIER_NAMES if m in BODY_COMPOSITION)
+COMP_VEC = _frozen([BODY_COMPOSITION[m] for m in BODY_MATERIALS])
+
+BODY_KG  = _frozen([PRODUCTS[p]["body_kg_per_unit"]  for p in PRODUCT_KEYS])
+GLAZE_KG = _frozen([PRODUCTS[p]["glaze_kg_per_unit"] for p in PRODUCT_KEYS])
+
+# (n_products,): wet glaze applied to one batch of each product
+BATCH_GLAZE_T    = _frozen(BATCH_SIZE_UNITS * GLAZE_KG / 1000)
+# (n_body_materials,): slip is mixed before the product is known, so it is
+# dosed for the demand-weighted average body
+SLIP_BATCH_T     = _frozen(BATCH_SIZE_UNITS * AVG_BODY_KG_UNIT * COMP_VEC / 1000)
+
+
+# ── Config bundle ─────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ConfigBundle:
+    """
+    Everything a simulation run reads from the configuration, as one object.
+
+    The factory and metrics collector take a bundle instead of importing the
+    module globals, so a run only touches fixed slots on a single object and
+    alternative configurations can be run side by side in one process.
+    ``eq=False`` keeps identity hashing, so a bundle can key caches.
+    """
+
+    # Scalars
+    sim_days:          int
+    sim_duration:      int
+    hours_per_day:     int
+    batch_size_units:  int
+
+    # Spec tables
+    products:          Mapping[str, ProductSpec]
+    machines:          Mapping[str, MachineSpec]
+    suppliers:         Mapping[str, SupplierSpec]
+    scenarios:         Mapping[str, ScenarioSpec]
+    demand:            Mapping[str, float]
+    quality:           Mapping[str, float]
+    financial:         Mapping[str, float]
+    initial_inventory: Mapping[str, float]   # t, by material
+    fg_initial_units:  Mapping[str, int]     # units, by product
+    customers:         Tuple[str, ...]
+    express_prob:      float
+
+    # Derived index tables / arrays (see the module-level constants above)
+    product_keys:          Tuple[str, ...]
+    product_idx:           Mapping[str, int]
+    machine_idx:           Mapping[str, int]
+    supplier_idx:          Mapping[str, int]
+    demand_share_cdf:      np.ndarray
+    product_price:         np.ndarray
+    grade_price_factor:    np.ndarray
+    lead_hr:               np.ndarray
+    price_mult:            np.ndarray
+    fg_max:                np.ndarray
+    fg_initial:            np.ndarray
+    machine_proc_mean:     np.ndarray
+    machine_proc_std:      np.ndarray
+    machine_mtbf:          np.ndarray
+    machine_mttr:          np.ndarray
+    supplier_reorder:      np.ndarray
+    supplier_reliability:  np.ndarray
+    body_materials:        Tuple[str, ...]
+    slip_batch_t:          np.ndarray
+    batch_glaze_t:         np.ndarray
+
+    # mappingproxy cannot be pickled and unpickled arrays come back writable,
+    # so pickle plain dicts and re-freeze everything on load.  Unpickled
+    # strings are fresh objects, so names are re-interned to share this
+    # process's key objects (see _interned).
+    def __getstate__(self):
+        return [
+            dict(v) if isinstance(v, MappingProxyType) else v
+            for v in (getattr(self, f) for f in self.__slots__)
+        ]
+
+    def __setstate__(self, state) -> None:
+        for f, v in zip(self.__slots__, state):
+            if isinstance(v, dict):
+                v = MappingProxyType({
+                    sys.intern(k) if isinstance(k, str) else k: x for k, x in v.items()
+                })
+            elif isinstance(v, tuple) and all(isinstance(k, str) for k in v):
+                v = tuple(sys.intern(k) for k in v)
+            elif isinstance(v, np.ndarray):
+                v.setflags(write=False)
+            object.__setattr__(self, f, v)
+
+
+def _build_config() -> ConfigBundle:
+    return ConfigBundle(
+        sim_days             = SIM_DAYS,
+        sim_duration         = SIM_DURATION,
+        hours_per_day        = HOURS_PER_DAY,
+        batch_size_units     = BATCH_SIZE_UNITS,
+        products             = PRODUCT_SPECS,
+        machines             = MACHINE_SPECS,
+        suppliers            = SUPPLIER_SPECS,
+        scenarios            = SCENARIO_SPECS,
+        demand               = MappingProxyType(dict(DEMAND)),
+        quality              = MappingProxyType(dict(QUALITY)),
+        financial            = MappingProxyType(dict(FINANCIAL)),
+        initial_inventory    = MappingProxyType(dict(INITIAL_INVENTORY)),
+        fg_initial_units     = MappingProxyType(dict(FG_INITIAL_UNITS)),
+        customers            = CUSTOMER_NAMES,
+        express_prob         = EXPRESS_PROB,
+        product_keys         = PRODUCT_KEYS,
+        product_idx          = MappingProxyType(PRODUCT_IDX),
+        machine_idx          = MappingProxyType(MACHINE_IDX),
+        supplier_idx         = MappingProxyType(SUPPLIER_IDX),
+        demand_share_cdf     = DEMAND_SHARE_CDF,
+        product_price        = PRODUCT_PRICE,
+        grade_price_factor   = GRADE_PRICE_FACTOR,
+        lead_hr              = LEAD_HR,
+        price_mult           = PRICE_MULT,
+        fg_max               = FG_MAX,
+        fg_initial           = FG_INITIAL,
+        machine_proc_mean    = MACHINE_PROC_MEAN,
+        machine_proc_std     = MACHINE_PROC_STD,
+        machine_mtbf         = MACHINE_MTBF,
+        machine_mttr         = MACHINE_MTTR,
+        supplier_reorder     = SUPPLIER_REORDER,
+        supplier_reliability = SUPPLIER_RELIABILITY,
+        body_materials       = BODY_MATERIALS,
+        slip_batch_t         = SLIP_BATCH_T,
+        batch_glaze_t        = BATCH_GLAZE_T,
+    )
+
+
+CONFIG: Final[ConfigBundle] = _build_config()
+
+
+# ── Expanded scenarios ────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class ScenarioState:
+    """A scenario's multipliers folded into the tables they scale."""
+
+    name:                 str
+    spec:                 ScenarioSpec
+    reorder_points:       np.ndarray   # t, aligned with SUPPLIER_NAMES
+    supplier_reliability: np.ndarray   # on-time probability, aligned with SUPPLIER_NAMES
+    machine_mtbf:         np.ndarray   # h, aligned with MACHINE_NAMES
+    demand_rate:          float        # customer orders per day
+    kiln_count:           int
+    # (n_suppliers, SIM_DURATION + 1) — True where ordering from that supplier
+    # is blocked at that whole simulation hour
+    disruption_mask:      np.ndarray
+
+
+@lru_cache(maxsize=None)
+def expand_scenario(name: str, config: ConfigBundle = CONFIG) -> ScenarioState:
+    """
+    Apply scenario *name*'s factors to *config* once.
+
+    Cached per (scenario, bundle), so repeated runs (seed sweeps,
+    Monte-Carlo replications) share the same read-only tables.
+    """
+    spec = config.scenarios[name]
+
+    mask = np.zeros((len(config.suppliers), config.sim_duration + 1), dtype=bool)
+    for d in spec.disruptions:   # inclusive windows, hours; may overlap
+        mask[config.supplier_idx[d.material],
+             math.ceil(d.start_hr):math.floor(d.end_hr) + 1] = True
+    mask.setflags(write=False)
+
+    return ScenarioState(
+        name                 = name,
+        spec                 = spec,
+        reorder_points       = _frozen(config.supplier_reorder * spec.safety_stock_factor),
+        supplier_reliability = _frozen(config.supplier_reliability * spec.supplier_reliability_factor),
+        machine_mtbf         = _frozen(config.machine_mtbf * spec.machine_reliability_factor),
+        demand_rate          = config.demand["mean_orders_per_day"] * spec.demand_factor,
+        kiln_count           = config.machines["kiln"].count + spec.extra_kilns,
+        disruption_mask      = mask,
+    )
@@ -7,37 +7,117 @@ Production pipeline (left → right):
         │
    [Slip Prep Lines]  ──────────────────── slip_buffer (Container)
         │
-   [Pressure Casting] ──────────────────── cast_store (Store of ProductionBatch)
+   [Pressure Casting] ──────────────────── one batch_route process per ProductionBatch
+        │                                  (stage_slots bound each stage's buffer)
+   [Demolding & Drying (18h)]
         │
-   [Demolding & Drying (18h)] ──────────── demolded_store (Store)
+   [Fettling]
         │
-   [Fettling]  ──────────────────────────── fettled_store (Store)
+   [Spray Glazing] ←── glaze raw-mat
         │
-   [Spray Glazing] ←── glaze raw-mat ────── glazed_store (Store)
+   [Tunnel Kiln (24h)] ★ bottleneck
         │
-   [Tunnel Kiln (24h)] ★ bottleneck ────── fired_store (Store)
+   [QC & Packaging]  ───────────────────── fg_level[product] (counter)
         │
-   [QC & Packaging]  ───────────────────── finished_goods[product] (Container)
-        │
-   Customer orders  ←── order_queue (Store)
+   Customer orders  ←── fulfilled on arrival from fg_level
 """
 
 from __future__ import annotations
 
 import math
-import random
-from typing import Dict, Tuple
+from collections import deque
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Tuple
 
+import numpy as np
 import simpy
 
-from .config import (
-    BATCH_SIZE_UNITS, BODY_COMPOSITION, AVG_BODY_KG_UNIT,
-    CUSTOMERS, DEMAND, FINANCIAL, FG_INITIAL_UNITS, FG_MAX_UNITS,
-    HOURS_PER_DAY, INITIAL_INVENTORY, MACHINES, PRODUCTS,
-    QUALITY, SCENARIOS, SUPPLIERS,
-)
-from .metrics import MetricsCollector
-from .models import BreakdownEvent, CustomerOrder, ProductionBatch, SupplierDelivery
+from .config_arrays import CONFIG, ConfigBundle, expand_scenario
+from .metrics import BATCH_COUNT_FIELDS, MetricsCollector, quality_split
+from .models import BreakdownEvent, CustomerOrder, ProductionBatch
+
+# Processing outcomes (time + breakdown) and the uniform / normal variates
+# used per batch and delivery are pre-sampled in blocks of this many draws
+SAMPLE_BLOCK = 1024
+
+# Machine groups a cast batch visits in batch_route, each with a bounded
+# buffer in stage_slots; batches holding those slots are the post-casting
+# work in progress
+ROUTE_STAGES = ("demolding", "fettling", "glazing", "kiln", "finishing")
+# Each route stage holds at most this many batches per machine (queued, in
+# service, or finished and blocked).  A batch claims a slot at the next stage
+# before releasing its current one, so a full stage stalls the one before it
+# and backpressure reaches casting and slip preparation instead of queues
+# growing without bound in front of the kiln.
+STAGE_SLOTS_PER_MACHINE = 2
+
+# Machine groups worked by exactly one process per machine (see
+# register_processes).  Each worker owns its machine, so it never requests
+# the group's resource; the FastResource is kept only for its capacity.
+DEDICATED_STAGES = ("slip_prep", "casting")
+# Machine groups that rarely queue; they get a FastResource instead of a
+# simpy.Resource (see below).  The kiln and glazing booths stay on real
+# Resources: they are where batches actually wait.
+FAST_STAGES = DEDICATED_STAGES + ("finishing",)
+
+
+class MirroredContainer(simpy.Container):
+    """
+    ``simpy.Container`` that copies its level into ``mirror[idx]``.
+
+    Hooks the put/get triggers, so the NumPy mirror is current after every
+    change and periodic checks can compare all containers in one operation.
+    """
+
+    def __init__(self, env, mirror: np.ndarray, idx: int, capacity, init) -> None:
+        self._mirror = mirror
+        self._idx    = idx
+        super().__init__(env, capacity=capacity, init=init)
+        mirror[idx] = init
+
+    def _do_put(self, event):
+        done = super()._do_put(event)
+        self._mirror[self._idx] = self._level
+        return done
+
+    def _do_get(self, event):
+        done = super()._do_get(event)
+        self._mirror[self._idx] = self._level
+        return done
+
+
+class FastResource:
+    """
+    Counting stand-in for ``simpy.Resource`` on rarely-contended machines.
+
+    ``acquire()`` returns ``None`` when a unit is free, so the caller carries
+    on without scheduling a request event; only when all units are busy does
+    it return an event to wait on.  ``release()`` hands the unit straight to
+    the longest waiter.  ``capacity`` and ``queue`` mirror the Resource
+    attributes the utilisation and WIP snapshots read.
+    """
+
+    __slots__ = ("env", "capacity", "busy", "queue")
+
+    def __init__(self, env: simpy.Environment, capacity: int) -> None:
+        self.env      = env
+        self.capacity = capacity
+        self.busy     = 0
+        self.queue    = deque()
+
+    def acquire(self):
+        if self.busy < self.capacity:
+            self.busy += 1
+            return None
+        wait = self.env.event()
+        self.queue.append(wait)
+        return wait
+
+    def release(self) -> None:
+        if self.queue:
+            self.queue.popleft().succeed()   # unit passes on, busy unchanged
+        else:
+            self.busy -= 1
 
 
 class CeramicFactory:
@@ -58,91 +138,187 @@ class CeramicFactory:
         env: simpy.Environment,
         scenario: str = "baseline",
         seed: int = 42,
+        config: ConfigBundle = CONFIG,
     ) -> None:
         self.env      = env
+        self.cfg      = config
         self.scenario = scenario
-        self.scen     = SCENARIOS[scenario]
+        self.state    = expand_scenario(scenario, config)
+        self.scen     = self.state.spec
 
-        random.seed(seed)
+        # The factory's only random source (PCG64); every draw below comes
+        # from it, mostly through the pre-sampled pools
+        self._rng = np.random.default_rng(seed)
 
         # ── Raw-material inventory (tonnes) ───────────────────────────────────
+        # Levels are mirrored into one array, aligned with config.suppliers
+        self._raw_level = np.zeros(len(config.suppliers))
         self.raw_mat: Dict[str, simpy.Container] = {}
-        for mat, cfg in SUPPLIERS.items():
-            init = INITIAL_INVENTORY[mat] * self.scen["safety_stock_factor"]
-            init = min(init, cfg["max_stock_t"])
-            self.raw_mat[mat] = simpy.Container(
-                env, capacity=cfg["max_stock_t"], init=init
+        for i, (mat, cfg) in enumerate(config.suppliers.items()):
+            init = config.initial_inventory[mat] * self.scen.safety_stock_factor
+            init = min(init, cfg.max_stock_t)
+            self.raw_mat[mat] = MirroredContainer(
+                env, self._raw_level, i, capacity=cfg.max_stock_t, init=init
             )
 
         # ── Inter-stage buffers ───────────────────────────────────────────────
         self.slip_buffer    = simpy.Container(env, capacity=5_000, init=200)
-        # Stores carry ProductionBatch objects so product type travels with the commode
-        self.cast_store      = simpy.Store(env)
-        self.demolded_store  = simpy.Store(env)
-        self.fettled_store   = simpy.Store(env)
-        self.glazed_store    = simpy.Store(env)
-        self.fired_store     = simpy.Store(env)
 
         # ── Finished-goods warehouse (units) ──────────────────────────────────
-        self.fg: Dict[str, simpy.Container] = {
-            prod: simpy.Container(
-                env,
-                capacity=FG_MAX_UNITS[prod],
-                init=FG_INITIAL_UNITS[prod],
-            )
-            for prod in PRODUCTS
-        }
+        # Plain counters: nothing ever waits on FG stock (finishing caps its
+        # put at the free space, fulfilment checks the level before taking),
+        # so a Container's event machinery would be pure overhead.
+        self.fg_level: Dict[str, int] = dict(zip(config.product_keys, config.fg_initial.tolist()))
+        self.fg_cap:   Dict[str, int] = dict(zip(config.product_keys, config.fg_max.tolist()))
 
         # ── Machine resources ─────────────────────────────────────────────────
-        self.machines: Dict[str, simpy.Resource] = {}
-        for key, cfg in MACHINES.items():
-            count = cfg["count"]
-            if key == "kiln":
-                count += self.scen["extra_kilns"]
-            self.machines[key] = simpy.Resource(env, capacity=count)
+        self.machines: Dict[str, simpy.Resource | FastResource] = {}
+        for key, cfg in config.machines.items():
+            count = self.state.kiln_count if key == "kiln" else cfg.count
+            if key in FAST_STAGES:
+                self.machines[key] = FastResource(env, count)
+            else:
+                self.machines[key] = simpy.Resource(env, capacity=count)
 
-        # ── Order queue (shared by multiple fulfilment workers) ───────────────
-        self.order_queue = simpy.Store(env)
+        # ── Bounded stage buffers (free-slot tokens, see STAGE_SLOTS_PER_MACHINE)
+        self.stage_slots: Dict[str, simpy.Container] = {}
+        for key in ROUTE_STAGES:
+            cap = STAGE_SLOTS_PER_MACHINE * self.machines[key].capacity
+            self.stage_slots[key] = simpy.Container(env, capacity=cap, init=cap)
 
         # ── Metrics ───────────────────────────────────────────────────────────
-        self.metrics = MetricsCollector(env)
+        self.metrics = MetricsCollector(
+            env, config, machine_capacity=[r.capacity for r in self.machines.values()],
+        )
 
         # ── Internal state ────────────────────────────────────────────────────
-        self._pending_replen: Dict[str, int] = {m: 0 for m in SUPPLIERS}
-        self._machine_busy_hr: Dict[str, float] = {k: 0.0 for k in MACHINES}
-        self._daily_prod: Dict[str, float] = {p: 0.0 for p in PRODUCTS}
+        self._pending_replen = np.zeros(len(config.suppliers), dtype=np.int8)   # in-flight orders
+        self._machine_busy_hr: List[float] = [0.0] * len(config.machines)   # by machine index
+        # Batches between their demolding slot and finishing (post-casting WIP)
+        self._wip = 0
+        self._daily_prod: List[int] = [0] * len(config.product_keys)   # units, by product index
+        # (bound get, tonnes per batch) for each body mineral, in
+        # config.body_materials order; shared by every slip-prep line
+        self._slip_draw: Tuple[Tuple[Callable, float], ...] = tuple(
+            zip([self.raw_mat[m].get for m in config.body_materials],
+                config.slip_batch_t.tolist())
+        )
+        # Glaze tonnes per batch by product, 0.0 for unglazed products
+        self._glaze_need: Dict[str, float] = {
+            p: (t if config.products[p].needs_glaze else 0.0)
+            for p, t in zip(config.product_keys, config.batch_glaze_t.tolist())
+        }
+        # Every batch is batch_size_units, so the units that pass grading and
+        # both functional tests are the same for all of them
+        split = quality_split([config.batch_size_units], config.quality)[0]
+        self._batch_fg_units = int(min(split[BATCH_COUNT_FIELDS.index("leak_test_pass")],
+                                       split[BATCH_COUNT_FIELDS.index("flush_test_pass")]))
+        # (product, demand share, fg target, 0.25 / target) per product, for
+        # _choose_product; the low-stock bonus is a multiply, not a divide
+        self._mix_tables: List[Tuple[str, float, float, float]] = [
+            (p, config.products[p].demand_share,
+             config.fg_initial_units[p] * 2.0, 0.125 / config.fg_initial_units[p])
+            for p in config.product_keys
+        ]
+        self._mix_cum: List[float] | None = None   # cumulative weights, None when stale
+        # Scenario MTBF and mean repair time per machine group, for the sampler
+        self._proc_mtbf = self.state.machine_mtbf
+        self._proc_mttr = config.machine_mttr
+        self._breakdown_cost = config.financial["breakdown_repair_cost_eur"]
+        self._supplier_rel  = self.state.supplier_reliability.tolist()
+
+        # ── Processing-time samplers (one specialised closure per group) ───
+        self._proc_time: Dict[str, Callable[[], Tuple[float, bool]]] = {
+            key: self._make_proc_time(key, m) for m, key in enumerate(config.machines)
+        }
+
+        # Standard uniform / normal variates, scaled per use
+        self._unif_pool: List[float] = []
+        self._unif_i = 0
+        self._norm_pool: List[float] = []
+        self._norm_i = 0
 
     # =========================================================================
     # Helpers
     # =========================================================================
 
-    def _proc_time(self, machine_key: str) -> Tuple[float, bool]:
+    def _sample_proc(self, m: int) -> Tuple[List[float], List[float]]:
         """
-        Sample processing time for one batch on *machine_key*.
+        Draw ``SAMPLE_BLOCK`` processing outcomes for machine index *m*.
 
-        Returns ``(duration_hours, had_breakdown)``.  If a breakdown occurs,
-        ``duration_hours`` already includes the repair time so the caller
-        just yields a single timeout.
+        A batch of base time *t* fails if the machine's time to failure,
+        Exponential(MTBF), falls inside *t* — the same event as "at least one
+        failure in *t* hours" with probability ``1 - exp(-t / MTBF)``, but
+        with no ``exp`` to evaluate.  A failed batch also gets an
+        exponential repair time.
         """
-        cfg     = MACHINES[machine_key]
-        rel     = self.scen["machine_reliability_factor"]
-        base_t  = max(0.05, random.normalvariate(cfg["proc_mean_hr"], cfg["proc_std_hr"]))
-        eff_mtbf = cfg["mtbf_hr"] * rel
-
-        # Probability of at least one failure in *base_t* hours of operation
-        p_fail  = 1.0 - math.exp(-base_t / eff_mtbf)
-        if random.random() < p_fail:
-            repair_t = random.expovariate(1.0 / cfg["mttr_hr"])
-            event = BreakdownEvent(
-                machine_id      = machine_key,
-                machine_name    = cfg["name"],
-                occurred_at     = self.env.now + base_t,
-                repair_duration = repair_t,
-                repair_cost_eur = FINANCIAL["breakdown_repair_cost_eur"],
-            )
-            self.metrics.breakdowns.append(event)
-            return base_t + repair_t, True
-        return base_t, False
+        rng    = self._rng
+        base   = np.maximum(0.05, rng.normal(
+            self.cfg.machine_proc_mean[m], self.cfg.machine_proc_std[m], SAMPLE_BLOCK,
+        ))
+        failed = rng.exponential(self._proc_mtbf[m], SAMPLE_BLOCK) < base
+        repair = np.where(failed, rng.exponential(self._proc_mttr[m], SAMPLE_BLOCK), 0.0)
+        return base.tolist(), repair.tolist()
+
+    def _next_uniform(self) -> float:
+        """Uniform variate on [0, 1)."""
+        i = self._unif_i
+        if i >= len(self._unif_pool):
+            self._unif_pool = self._rng.random(SAMPLE_BLOCK).tolist()
+            i = 0
+        self._unif_i = i + 1
+        return self._unif_pool[i]
+
+    def _next_norm(self, mu: float, sigma: float) -> float:
+        """Normal variate with mean *mu* and standard deviation *sigma*."""
+        i = self._norm_i
+        if i >= len(self._norm_pool):
+            self._norm_pool = self._rng.standard_normal(SAMPLE_BLOCK).tolist()
+            i = 0
+        self._norm_i = i + 1
+        return mu + sigma * self._norm_pool[i]
+
+    def _make_proc_time(self, machine_key: str, m: int) -> Callable[[], Tuple[float, bool]]:
+        """
+        Build the processing-time sampler for *machine_key* (machine index *m*).
+
+        The sampler returns ``(duration_hours, had_breakdown)`` for one batch.
+        If a breakdown occurs, ``duration_hours`` already includes the repair
+        time so the caller just yields a single timeout.  Its block of
+        pre-sampled outcomes, cursor and the group's constants live in the
+        closure, so a call does no dict or attribute lookups for them.
+        """
+        env        = self.env
+        breakdowns = self.metrics.breakdowns
+        name       = self.cfg.machines[machine_key].name
+        cost       = self._breakdown_cost
+        sample     = self._sample_proc
+        # (base times, repair times), repair 0.0 where the machine did not
+        # fail; consumed by the cursor and redrawn when exhausted
+        base, repair = sample(m)
+        i = 0
+
+        def proc_time() -> Tuple[float, bool]:
+            nonlocal base, repair, i
+            if i >= len(base):
+                base, repair = sample(m)
+                i = 0
+            base_t, repair_t = base[i], repair[i]
+            i += 1
+
+            if repair_t:
+                breakdowns.append(BreakdownEvent(
+                    machine_id      = machine_key,
+                    machine_idx     = m,
+                    machine_name    = name,
+                    occurred_at     = env.now + base_t,
+                    repair_duration = repair_t,
+                    repair_cost_eur = cost,
+                ))
+                return base_t + repair_t, True
+            return base_t, False
+
+        return proc_time
 
     def _choose_product(self) -> str:
         """
@@ -151,20 +327,22 @@ class CeramicFactory:
         Biases toward products whose finished-goods level is below target
         so the factory naturally replenishes low-stock SKUs.
         """
-        scores = {}
-        for prod, cfg in PRODUCTS.items():
-            level  = self.fg[prod].level
-            target = FG_INITIAL_UNITS[prod] * 2.0
-            deficit_bonus = max(0.0, (target - level) / target) * 0.25
-            scores[prod]  = cfg["demand_share"] + deficit_bonus
-
-        total = sum(scores.values())
-        r, cum = random.random() * total, 0.0
-        for prod, s in scores.items():
-            cum += s
-            if r <= cum:
-                return prod
-        return list(PRODUCTS.keys())[0]
+        # The weights depend only on FG levels; reuse them until finishing or
+        # fulfilment changes a level (they clear the cache)
+        cum = self._mix_cum
+        if cum is None:
+            cum, total = [], 0.0
+            fg_level   = self.fg_level
+            append     = cum.append
+            for prod, share, target, bonus in self._mix_tables:
+                short = target - fg_level[prod]
+                total += share + short * bonus if short > 0 else share
+                append(total)
+            self._mix_cum = cum
+
+        i    = bisect_left(cum, self._next_uniform() * cum[-1])
+        keys = self.cfg.product_keys
+        return keys[i] if i < len(keys) else keys[0]
 
     # =========================================================================
     # Supply-chain processes
@@ -176,25 +354,27 @@ class CeramicFactory:
         Triggers replenishment orders when stock falls below the reorder point.
         A maximum of 2 in-flight orders per material prevents over-ordering.
         """
+        mask      = self.state.disruption_mask
+        horizon   = mask.shape[1]
+        reorder   = self.state.reorder_points
+        level     = self._raw_level
+        pending   = self._pending_replen
+        materials = tuple(self.cfg.suppliers)
         while True:
             yield self.env.timeout(4)
 
-            for mat, cfg in SUPPLIERS.items():
-                # ── Scenario: kaolin supply disruption ────────────────────────
-                disruption = self.scen["kaolin_disruption"]
-                if disruption and mat == "kaolin":
-                    d_start, d_end = disruption
-                    if d_start <= self.env.now <= d_end:
-                        self.metrics.disruption_hours += 4
-                        continue   # No kaolin orders during the strike
-
-                reorder_pt = cfg["reorder_point_t"] * self.scen["safety_stock_factor"]
-                if (
-                    self.raw_mat[mat].level < reorder_pt
-                    and self._pending_replen[mat] < 2
-                ):
-                    self._pending_replen[mat] += 1
-                    self.env.process(self._supplier_delivery(mat))
+            # ── Scenario: supplier disruptions (e.g. kaolin port strike) ─────
+            # No orders to a supplier during its disruption
+            t    = int(self.env.now)
+            need = (level < reorder) & (pending < 2)
+            if t < horizon:
+                blocked = mask[:, t]
+                self.metrics.disruption_hours += 4 * int(blocked.sum())
+                need &= ~blocked
+
+            for i in np.flatnonzero(need).tolist():
+                pending[i] += 1
+                self.env.process(self._supplier_delivery(materials[i]))
 
     def _supplier_delivery(self, material: str):
         """
@@ -203,35 +383,27 @@ class CeramicFactory:
           2. Apply reliability — unreliable suppliers add random delays.
           3. Arrive at factory gate and top up the raw-material container.
         """
-        cfg        = SUPPLIERS[material]
-        ordered_at = self.env.now
-        rel_factor = self.scen["supplier_reliability_factor"]
-
-        lead_t  = max(4.0, random.normalvariate(
-            cfg["lead_time_mean_hr"], cfg["lead_time_std_hr"]
-        ))
-        eff_rel = cfg["reliability"] * rel_factor
-        on_time = random.random() < eff_rel
+        env        = self.env
+        uniform    = self._next_uniform
+        cfg        = self.cfg.suppliers[material]
+        store      = self.raw_mat[material]
+        ordered_at = env.now
+
+        lead_t  = max(4.0, self._next_norm(cfg.lead_time_mean_hr, cfg.lead_time_std_hr))
+        sid     = self.cfg.supplier_idx[material]
+        eff_rel = self._supplier_rel[sid]
+        on_time = uniform() < eff_rel
         if not on_time:
-            lead_t *= random.uniform(1.25, 2.50)   # Late delivery penalty
+            lead_t *= 1.25 + 1.25 * uniform()   # Late delivery penalty
 
-        yield self.env.timeout(lead_t)
+        yield env.timeout(lead_t)
 
-        space   = self.raw_mat[material].capacity - self.raw_mat[material].level
-        qty     = min(cfg["delivery_qty_t"], space)
+        qty = min(cfg.delivery_qty_t, store.capacity - store.level)
         if qty > 0:
-            yield self.raw_mat[material].put(qty)
-
-        self.metrics.deliveries.append(SupplierDelivery(
-            supplier_name   = cfg["name"],
-            material        = material,
-            quantity_tonnes = qty,
-            unit_cost_eur_t = cfg["unit_cost_eur_t"],
-            ordered_at      = ordered_at,
-            delivered_at    = self.env.now,
-            on_time         = on_time,
-        ))
-        self._pending_replen[material] -= 1
+            yield store.put(qty)
+
+        self.metrics.record_delivery(sid, qty, ordered_at, env.now, on_time)
+        self._pending_replen[sid] -= 1
 
     # =========================================================================
     # Production stages
@@ -244,207 +416,212 @@ class CeramicFactory:
         Consumes raw materials and produces ceramic slip.
         One SimPy process instance per slip-prep line.
         """
-        BATCH = BATCH_SIZE_UNITS
-
-        # Tonnes of each mineral consumed per batch
-        mat_per_batch = {
-            mat: BATCH * AVG_BODY_KG_UNIT * frac / 1000   # kg → t
-            for mat, frac in BODY_COMPOSITION.items()
-        }
+        # Bound once: the loop body runs for every batch of the simulation
+        env          = self.env
+        record_stall = self.metrics.record_stall
+        record_stage = self.metrics.record_stage
+        sid          = self.cfg.machine_idx["slip_prep"]
+        proc_time    = self._proc_time["slip_prep"]
+        busy         = self._machine_busy_hr
+        timeout      = env.timeout
+        all_of       = env.all_of
+        slip_put     = self.slip_buffer.put
+        slip_draw    = self._slip_draw
+        BATCH        = self.cfg.batch_size_units
 
         while True:
-            # ── Wait until all raw materials are available ──────────────────
-            while not all(
-                self.raw_mat[m].level >= qty
-                for m, qty in mat_per_batch.items()
-            ):
-                self.metrics.record_stall("slip_prep")
-                yield self.env.timeout(1.0)   # poll every hour
-
             # ── Consume raw materials ────────────────────────────────────────
-            # (Safe: we checked all levels; no yield between checks and gets,
-            #  so no other body-prep process can interleave and steal stock.)
-            for m, qty in mat_per_batch.items():
-                yield self.raw_mat[m].get(qty)
-
-            # ── Process on a slip-prep line ──────────────────────────────────
-            with self.machines["slip_prep"].request() as req:
-                yield req
-                t, _ = self._proc_time("slip_prep")
-                yield self.env.timeout(t)
-                self._machine_busy_hr["slip_prep"] += t
-
-            yield self.slip_buffer.put(BATCH)
-            self.metrics.record_stage("slip_prep", BATCH)
+            # All four gets are issued together and the line resumes once
+            # every one is met; a short mineral wakes it on its next delivery.
+            # Container gets are served strictly FIFO, and each line files
+            # into all four queues at the same instant, so the line that
+            # asked first is first in every queue and partially filled lines
+            # cannot deadlock each other.
+            t0 = env.now
+            yield all_of([get(qty) for get, qty in slip_draw])
+            if env.now > t0:
+                record_stall("slip_prep", t0, env.now)
+
+            # ── Process on this worker's own slip-prep line ──────────────────
+            t, _ = proc_time()
+            yield timeout(t)
+            busy[sid] += t
+
+            yield slip_put(BATCH)
+            record_stage(sid, BATCH)
 
     def pressure_casting(self):
         """
         Stage 2 — Pressure casting.
 
         Gets slip from the buffer, assigns a product type, produces a
-        ProductionBatch object that carries the product identity downstream.
+        ProductionBatch object that carries the product identity downstream
+        and hands it to its own ``batch_route`` process.
         One process per casting mold.
         """
-        BATCH = BATCH_SIZE_UNITS
+        env          = self.env
+        process      = env.process
+        record_stage = self.metrics.record_stage
+        sid          = self.cfg.machine_idx["casting"]
+        proc_time    = self._proc_time["casting"]
+        busy         = self._machine_busy_hr
+        timeout      = env.timeout
+        route        = self.batch_route
+        choose       = self._choose_product
+        slot_get     = self.stage_slots["demolding"].get
+        slip_get     = self.slip_buffer.get
+        BATCH        = self.cfg.batch_size_units
+
         while True:
-            yield self.slip_buffer.get(BATCH)
-            product = self._choose_product()
+            yield slip_get(BATCH)
+            product = choose()
 
-            with self.machines["casting"].request() as req:
-                yield req
-                t, _ = self._proc_time("casting")
-                yield self.env.timeout(t)
-                self._machine_busy_hr["casting"] += t
+            t, _ = proc_time()                  # on this worker's own mold
+            yield timeout(t)
+            busy[sid] += t
 
+            now   = env.now
             batch = ProductionBatch(
-                product      = product,
-                quantity_units  = BATCH,
-                created_at   = self.env.now,
-                casting_done = self.env.now,
+                product        = product,
+                quantity_units = BATCH,
+                created_at     = now,
+                casting_done   = now,
             )
-            yield self.cast_store.put(batch)
-            self.metrics.record_stage("casting", BATCH)
-
-    def demolding_and_drying(self):
+            record_stage(sid, BATCH)
+            # The cast batch stays on its mold while demolding is full, so a
+            # full stage blocks casting on put rather than before it starts
+            yield slot_get(1)
+            self._wip += 1
+            process(route(batch))
+
+    def _operate(self, machine_key: str):
+        """Queue for one machine in *machine_key*'s group and process a batch on it."""
+        res = self.machines[machine_key]
+        mid = self.cfg.machine_idx[machine_key]
+        if type(res) is FastResource:
+            wait = res.acquire()
+            if wait is not None:
+                yield wait
+            t, _ = self._proc_time[machine_key]()
+            yield self.env.timeout(t)
+            self._machine_busy_hr[mid] += t
+            res.release()
+            return
+        with res.request() as req:
+            yield req
+            t, _ = self._proc_time[machine_key]()
+            yield self.env.timeout(t)
+            self._machine_busy_hr[mid] += t
+
+    def _advance(self, from_stage: str, to_stage: str):
+        """Claim a slot at *to_stage*, then free the batch's slot at *from_stage*."""
+        yield self.stage_slots[to_stage].get(1)
+        self.stage_slots[from_stage].put(1)
+
+    def batch_route(self, batch: ProductionBatch):
         """
-        Stage 3 — Demolding and initial drying (18h).
-        
-        Extract commodes from gypsum molds and air dry for 12-24 hours.
-        This is a time-consuming but essential step for dimensional stability.
+        Stages 3–7 for one cast batch, as a single process.
+
+        The batch moves through the machine groups in turn instead of being
+        handed between worker processes through Stores.  Each stage's
+        buffer is its ``stage_slots`` container: ``advance`` claims a slot
+        at the next stage before freeing the current one (blocking while
+        that stage is full), then ``operate`` queues for one of its
+        machines.  The caller has already claimed the demolding slot, and
+        the finishing slot is freed once the batch reaches FG.
         """
-        while True:
-            batch = yield self.cast_store.get()
-            
-            with self.machines["demolding"].request() as req:
-                yield req
-                t, _ = self._proc_time("demolding")
-                yield self.env.timeout(t)
-                self._machine_busy_hr["demolding"] += t
-            
-            batch.demolded_at = self.env.now
-            yield self.demolded_store.put(batch)
-            self.metrics.record_stage("demolding", batch.quantity_units)
-    
-    def fettling(self):
-        """
-        Stage 4 — Fettling and trimming.
-        
-        Remove mold seams, smooth edges, and create water passages.
-        Critical for product quality and functionality.
-        """
-        while True:
-            batch = yield self.demolded_store.get()
-            
-            with self.machines["fettling"].request() as req:
-                yield req
-                t, _ = self._proc_time("fettling")
-                yield self.env.timeout(t)
-                self._machine_busy_hr["fettling"] += t
-            
-            batch.fettled_at = self.env.now
-            yield self.fettled_store.put(batch)
-            self.metrics.record_stage("fettling", batch.quantity_units)
-
-    def spray_glazing(self):
-        """
-        Stage 5 — Spray glazing.
-
-        All commode products require interior and exterior glazing.
-        Applied via spray booths (manual or robotic).
-        One process per glazing booth.
-        """
-        while True:
-            batch = yield self.fettled_store.get()
-            cfg   = PRODUCTS[batch.product]
-
-            if cfg["needs_glaze"]:
-                glaze_qty = batch.quantity_units * cfg["glaze_kg_per_unit"] / 1000  # t
-
-                # ── Wait for glaze material ──────────────────────────────────
-                while self.raw_mat["glaze"].level < glaze_qty:
-                    self.metrics.record_stall("glazing")
-                    yield self.env.timeout(1.0)
+        env     = self.env
+        cfg     = self.cfg
+        units   = batch.quantity_units
+        operate = self._operate
+        advance = self._advance
+        record  = self.metrics.record_stage
+        sid     = cfg.machine_idx   # stage ids for metrics.record_stage
+
+        # ── Stage 3 — Demolding and initial drying (18h) ────────────────────
+        # Extract commodes from gypsum molds and air dry for 12-24 hours;
+        # time-consuming but essential for dimensional stability.
+        yield from operate("demolding")
+        batch.demolded_at = env.now
+        record(sid["demolding"], units)
+
+        # ── Stage 4 — Fettling and trimming ─────────────────────────────────
+        # Remove mold seams, smooth edges, and create water passages.
+        yield from advance("demolding", "fettling")
+        yield from operate("fettling")
+        batch.fettled_at = env.now
+        record(sid["fettling"], units)
+
+        # ── Stage 5 — Spray glazing (interior + exterior) ───────────────────
+        yield from advance("fettling", "glazing")
+        glaze_qty = self._glaze_need[batch.product]
+        if glaze_qty:
+            # Wait for glaze material (woken by the next delivery)
+            t0 = env.now
+            yield self.raw_mat["glaze"].get(glaze_qty)
+            if env.now > t0:
+                self.metrics.record_stall("glazing", t0, env.now)
+
+            yield from operate("glazing")
+        batch.glazing_done = env.now
+        record(sid["glazing"], units)
+
+        # ── Stage 6 — Tunnel kiln firing (24h cycle)  ★ bottleneck ──────────
+        # Breakdowns here have the biggest impact on throughput.
+        yield from advance("glazing", "kiln")
+        yield from operate("kiln")
+        batch.firing_done = env.now
+        record(sid["kiln"], units)
+
+        # ── Stage 7 — Sorting, grading, functional testing, packaging ───────
+        yield from advance("kiln", "finishing")
+        yield from operate("finishing")
+
+        # Grade and test columns are filled in bulk by metrics.finalize(), so
+        # the live batch is only stamped; completed_batches derives its totals
+        final_saleable = self._batch_fg_units
+
+        batch.finished_at = env.now
+
+        # Add saleable commodes to finished-goods warehouse (capped at capacity)
+        prod    = batch.product
+        put_qty = max(0, min(final_saleable, self.fg_cap[prod] - self.fg_level[prod]))
+        if put_qty:
+            self.fg_level[prod] += put_qty
+            self._mix_cum = None
+
+        self.metrics.record_batch(batch)
+        record(sid["finishing"], units)
+        self.stage_slots["finishing"].put(1)
+        self._wip -= 1
+        self._daily_prod[cfg.product_idx[batch.product]] += put_qty
 
-                yield self.raw_mat["glaze"].get(glaze_qty)
-
-                with self.machines["glazing"].request() as req:
-                    yield req
-                    t, _ = self._proc_time("glazing")
-                    yield self.env.timeout(t)
-                    self._machine_busy_hr["glazing"] += t
-
-            batch.glazing_done = self.env.now
-            yield self.glazed_store.put(batch)
-            self.metrics.record_stage("glazing", batch.quantity_units)
-
-    def kiln_firing(self):
-        """
-        Stage 6 — Tunnel kiln firing (24h cycle).  ★ The production bottleneck.
-
-        One process per kiln.  24-hour firing cycle makes this the critical constraint.
-        Breakdowns here have the biggest impact on throughput.
-        """
-        while True:
-            batch = yield self.glazed_store.get()
-
-            with self.machines["kiln"].request() as req:
-                yield req
-                t, _ = self._proc_time("kiln")
-                yield self.env.timeout(t)
-                self._machine_busy_hr["kiln"] += t
-
-            batch.firing_done = self.env.now
-            yield self.fired_store.put(batch)
-            self.metrics.record_stage("kiln", batch.quantity_units)
+    # =========================================================================
+    # Demand & order fulfilment
+    # =========================================================================
 
-    def finishing(self):
+    def _draw_orders(self, n: int, rate_hr: float) -> Iterator[Tuple[float, int, int, int, int]]:
         """
-        Stage 5 — Optical sorting, grading, and palletised packaging.
+        Attributes of the next *n* orders, drawn as one burst.
 
-        Applies the quality split (Grade A / Grade B / Reject) and moves
-        saleable tiles into the finished-goods warehouse.
-        One process per sorting & packaging line.
+        Yields ``(gap_hr, customer_idx, product_idx, express, quantity_units)``
+        per order; *gap_hr* is the exponential inter-arrival time before it.
         """
-        while True:
-            batch = yield self.fired_store.get()
-
-            with self.machines["finishing"].request() as req:
-                yield req
-                t, _ = self._proc_time("finishing")
-                yield self.env.timeout(t)
-                self._machine_busy_hr["finishing"] += t
-
-            q              = QUALITY
-            batch.grade_a_units = int(batch.quantity_units * q["grade_a_rate"])
-            batch.grade_b_units = int(batch.quantity_units * q["grade_b_rate"])
-            batch.reject_units  = int(batch.quantity_units * q["reject_rate"])
-            
-            # Functional testing (leak test, flush test)
-            saleable = batch.saleable_units
-            batch.leak_test_pass = int(saleable * q["leak_test_pass_rate"])
-            batch.flush_test_pass = int(saleable * q["flush_test_pass_rate"])
-            
-            # Only units passing both tests go to FG
-            final_saleable = min(batch.leak_test_pass, batch.flush_test_pass)
-            
-            batch.finished_at = self.env.now
-
-            # Add saleable commodes to finished-goods warehouse (capped at capacity)
-            fg_store = self.fg[batch.product]
-            space    = fg_store.capacity - fg_store.level
-            put_qty  = min(final_saleable, space)
-            if put_qty > 0:
-                yield fg_store.put(put_qty)
-
-            self.metrics.completed_batches.append(batch)
-            self.metrics.record_stage("finishing", batch.quantity_units)
-            self._daily_prod[batch.product] = (
-                self._daily_prod.get(batch.product, 0) + put_qty
-            )
-
-    # =========================================================================
-    # Demand & order fulfilment
-    # =========================================================================
+        rng    = self._rng
+        cfg    = self.cfg
+        demand = cfg.demand
+        cdf    = cfg.demand_share_cdf
+        prod   = np.searchsorted(cdf, rng.random(n) * cdf[-1], side="right")
+        qty    = np.maximum(demand["min_order_units"], rng.normal(
+            demand["mean_order_units"], demand["std_order_units"], n,
+        ))
+        return zip(
+            rng.exponential(1.0 / rate_hr, n).tolist(),
+            rng.integers(0, len(cfg.customers), n).tolist(),
+            np.minimum(prod, len(cdf) - 1).tolist(),
+            (rng.random(n) < cfg.express_prob).astype(np.int8).tolist(),
+            np.rint(qty).astype(np.int64).tolist(),
+        )
 
     def demand_generator(self):
         """
@@ -453,69 +630,74 @@ class CeramicFactory:
         Inter-arrival times are Exponential(λ) where λ = orders/hour.
         Order sizes are drawn from a truncated Normal distribution.
         """
-        counter = 0
+        cfg         = self.cfg
+        env         = self.env
+        keys        = cfg.product_keys
+        counter     = 0
+        rate_hr     = self.state.demand_rate / cfg.hours_per_day
+        lead_hr     = cfg.lead_hr.tolist()      # [standard, express]
+        # Unit price by [product index][express]
+        prices      = np.outer(cfg.product_price, cfg.price_mult).tolist()
+        customers   = cfg.customers
+        fulfil      = self._fulfil
+        record      = self.metrics.record_order
+
+        # Orders come in bursts sized for the whole horizon (with headroom
+        # over the expected count), so a run normally draws only one
+        burst = math.ceil(self.state.demand_rate * cfg.sim_days * 1.25) + 16
         while True:
-            df        = self.scen["demand_factor"]
-            rate_hr   = DEMAND["mean_orders_per_day"] * df / HOURS_PER_DAY
-            yield self.env.timeout(random.expovariate(rate_hr))
-
-            counter += 1
-            is_express = random.random() < DEMAND["express_fraction"]
-            product    = random.choices(
-                list(PRODUCTS.keys()),
-                weights=[PRODUCTS[p]["demand_share"] for p in PRODUCTS],
-            )[0]
-            qty = max(
-                DEMAND["min_order_units"],
-                random.normalvariate(DEMAND["mean_order_units"], DEMAND["std_order_units"]),
-            )
-            lead_days  = (DEMAND["express_lead_time_days"] if is_express
-                          else DEMAND["std_lead_time_days"])
-            base_price = PRODUCTS[product]["price_eur_unit"]
-            unit_price = base_price * (DEMAND["express_premium"] if is_express else 1.0)
-
-            order = CustomerOrder(
-                order_id    = f"ORD-{counter:04d}",
-                customer    = random.choice(CUSTOMERS),
-                product     = product,
-                quantity_units = int(round(qty)),
-                is_express  = is_express,
-                created_at  = self.env.now,
-                due_at      = self.env.now + lead_days * HOURS_PER_DAY,
-                unit_price  = unit_price,
-            )
-            self.metrics.orders.append(order)
-            yield self.order_queue.put(order)
-
-    def order_fulfilment(self):
+            for gap, customer, k, express, qty in self._draw_orders(burst, rate_hr):
+                yield env.timeout(gap)
+
+                counter += 1
+                now   = env.now
+                order = CustomerOrder(
+                    order_id       = f"ORD-{counter:04d}",
+                    customer_idx   = customer,
+                    product        = keys[k],
+                    quantity_units = qty,
+                    is_express     = bool(express),
+                    created_at     = now,
+                    due_at         = now + lead_hr[express],
+                    unit_price     = prices[k][express],
+                    customers      = customers,
+                )
+                fulfil(order)
+                record(order)
+
+    def _fulfil(self, order: CustomerOrder) -> None:
         """
-        Picks orders from the shared queue and ships from finished-goods stock.
+        Ship *order* from finished-goods stock the moment it arrives.
+
+        Fulfilment takes no simulated time and only touches the FG counters,
+        so it runs inline in ``demand_generator`` rather than as queued
+        worker processes.
 
         Full fulfilment: ship everything immediately.
         Partial fulfilment: ship what is available, record a partial.
         Zero stock: record a stockout.
         """
-        while True:
-            order = yield self.order_queue.get()
-            fg    = self.fg[order.product]
-            avail = fg.level
-
-            if avail >= order.quantity_units:
-                yield fg.get(order.quantity_units)
-                order.fulfilled_qty = order.quantity_units
-            elif avail > 0:
-                yield fg.get(avail)
-                order.fulfilled_qty = avail
-                self.metrics.partial_fulfils += 1
-            else:
-                # Complete stockout — lost sale
-                self.metrics.stockout_events.append({
-                    "time":        self.env.now,
-                    "product":     order.product,
-                    "quantity_units": order.quantity_units,
-                })
+        prod  = order.product
+        avail = self.fg_level[prod]
+
+        if avail >= order.quantity_units:
+            self.fg_level[prod] = avail - order.quantity_units
+            self._mix_cum       = None
+            order.fulfilled_qty = order.quantity_units
+        elif avail > 0:
+            self.fg_level[prod] = 0
+            self._mix_cum       = None
+            order.fulfilled_qty = avail
+            self.metrics.partial_fulfils += 1
+        else:
+            # Complete stockout — lost sale
+            self.metrics.stockout_events.append({
+                "time":        self.env.now,
+                "product":     order.product,
+                "quantity_units": order.quantity_units,
+            })
 
-            order.fulfilled_at = self.env.now
+        order.fulfilled_at = self.env.now
 
     # =========================================================================
     # Monitoring
@@ -525,34 +707,28 @@ class CeramicFactory:
         """
         Snapshots key system state once per simulated day for trend charts.
         """
+        env      = self.env
+        record   = self.metrics.record_snapshot
+        day_hr   = self.cfg.hours_per_day
+        produced = self._daily_prod              # reset in place after each row
+        zeros    = (0,) * len(produced)
+        fg       = self.fg_level.values()          # live view, read once a day
+        busy     = self._machine_busy_hr
+        day      = 0
         while True:
-            yield self.env.timeout(HOURS_PER_DAY)
-            day = int(self.env.now / HOURS_PER_DAY)
-
-            self.metrics.daily_snapshots.append({
-                "day":           day,
-                "raw_mat":       {m: self.raw_mat[m].level for m in SUPPLIERS},
-                "slip":          self.slip_buffer.level,
-                "fg":            {p: self.fg[p].level for p in PRODUCTS},
-                "produced_units": dict(self._daily_prod),
-                "wip":           (len(self.cast_store.items)
-                                  + len(self.demolded_store.items)
-                                  + len(self.fettled_store.items)
-                                  + len(self.glazed_store.items)
-                                  + len(self.fired_store.items)),
-                "utilization":   self._current_utilization(),
-            })
-            self._daily_prod = {p: 0 for p in PRODUCTS}
-
-    def _current_utilization(self) -> Dict[str, float]:
-        """Cumulative utilisation fraction for each machine group."""
-        util = {}
-        for key, res in self.machines.items():
-            denom = res.capacity * self.env.now
-            util[key] = (
-                min(1.0, self._machine_busy_hr[key] / denom) if denom > 0 else 0.0
+            yield env.timeout(day_hr)
+            day += 1
+
+            record(
+                day         = day,
+                raw_mat     = self._raw_level,
+                slip        = self.slip_buffer.level,
+                fg          = list(fg),
+                produced    = produced,
+                wip         = self._wip,
+                busy_hr     = list(busy),
             )
-        return util
+            produced[:] = zeros
 
     # =========================================================================
     # Bootstrap
@@ -562,37 +738,24 @@ class CeramicFactory:
         """
         Register every SimPy process.  Call this before ``env.run()``.
         """
-        env = self.env
+        env      = self.env
+        machines = self.machines
 
         # Supply chain
         env.process(self.supply_monitor())
         # Kick-start initial deliveries for all materials
-        for mat in SUPPLIERS:
+        for mat in self.cfg.suppliers:
             env.process(self._supplier_delivery(mat))
 
-        # Production pipeline — N workers per stage ≈ N machines
-        for _ in range(MACHINES["slip_prep"]["count"]):
+        # Production pipeline — one worker per machine (DEDICATED_STAGES)
+        for _ in range(machines["slip_prep"].capacity):
             env.process(self.slip_preparation())
-        for _ in range(MACHINES["casting"]["count"]):
+        for _ in range(machines["casting"].capacity):
             env.process(self.pressure_casting())
-        for _ in range(MACHINES["demolding"]["count"]):
-            env.process(self.demolding_and_drying())
-        for _ in range(MACHINES["fettling"]["count"]):
-            env.process(self.fettling())
-        for _ in range(MACHINES["glazing"]["count"]):
-            env.process(self.spray_glazing())
-
-        kiln_count = MACHINES["kiln"]["count"] + self.scen["extra_kilns"]
-        for _ in range(kiln_count):
-            env.process(self.kiln_firing())
-
-        for _ in range(MACHINES["finishing"]["count"]):
-            env.process(self.finishing())
+        # Stages 3–7 run as one batch_route process per cast batch
 
-        # Demand & fulfilment
+        # Demand (orders are fulfilled as they arrive)
         env.process(self.demand_generator())
-        for _ in range(4):   # 4 fulfilment workers → no bottleneck here
-            env.process(self.order_fulfilment())
 
         # Daily KPI snapshot
         env.process(self.daily_recorder())
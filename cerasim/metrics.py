@@ -1,28 +1,97 @@
 """Metrics collection and KPI computation."""
 
 from __future__ import annotations
+from array import array
+from operator import attrgetter, itemgetter
 from typing import Dict, List, Tuple, TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     import simpy
 
-from .config import (
-    PRODUCTS, SUPPLIERS, MACHINES, QUALITY, FINANCIAL,
-    HOURS_PER_DAY, BATCH_SIZE_UNITS,
+from .config_arrays import CONFIG, ConfigBundle
+from .models import (
+    ProductionBatch, CustomerOrder, SupplierDelivery, BreakdownEvent, next_delivery_id,
 )
-from .models import ProductionBatch, CustomerOrder, SupplierDelivery, BreakdownEvent
+
+
+# Columns of the completed-batch arrays, in ProductionBatch field names
+BATCH_TIME_FIELDS  = ("created_at", "casting_done", "demolded_at", "fettled_at",
+                      "glazing_done", "firing_done", "finished_at")
+BATCH_COUNT_FIELDS = ("quantity_units", "grade_a_units", "grade_b_units", "reject_units",
+                      "leak_test_pass", "flush_test_pass")
+_A, _B, _REJ = (BATCH_COUNT_FIELDS.index(f)
+                for f in ("grade_a_units", "grade_b_units", "reject_units"))
+_QTY = BATCH_COUNT_FIELDS.index("quantity_units")
+_CREATED, _FINISHED = BATCH_TIME_FIELDS.index("created_at"), BATCH_TIME_FIELDS.index("finished_at")
+
+# CustomerOrder fields read into the KPI order table, in column order
+_ORDER_COLUMNS = attrgetter("quantity_units", "fulfilled_qty", "created_at", "fulfilled_at",
+                            "due_at", "unit_price", "customer_idx")
+_MACHINE_IDX   = attrgetter("machine_idx")
+_REPAIR_HR     = attrgetter("repair_duration")
+_STOCKOUT_QTY  = itemgetter("quantity_units")
+
+
+def quality_split(units: np.ndarray, quality: Dict[str, float]) -> np.ndarray:
+    """
+    Grade and test outcomes for batches of *units* commodes.
+
+    Returns one row per batch with the ``BATCH_COUNT_FIELDS`` columns:
+    whole units of grade A, grade B and reject, then the saleable units
+    passing the leak and flush tests.
+    """
+    units = np.asarray(units, dtype=np.int64)
+    out   = np.empty((len(units), len(BATCH_COUNT_FIELDS)), dtype=np.int64)
+    out[:, _QTY] = units
+    out[:, _A]   = units * quality["grade_a_rate"]
+    out[:, _B]   = units * quality["grade_b_rate"]
+    out[:, _REJ] = units * quality["reject_rate"]
+    saleable     = out[:, _A] + out[:, _B]
+    out[:, BATCH_COUNT_FIELDS.index("leak_test_pass")]  = saleable * quality["leak_test_pass_rate"]
+    out[:, BATCH_COUNT_FIELDS.index("flush_test_pass")] = saleable * quality["flush_test_pass_rate"]
+    return out
+
+
+def reduce_batches(counts: np.ndarray, times: np.ndarray, product_idx: np.ndarray,
+                   n_products: int) -> Tuple[np.ndarray, float, int]:
+    """
+    Reduction of a block of completed-batch columns.
+
+    Returns ``(by_product, cycle_time_sum_hr, n_timed)``: *by_product* is a
+    ``3 × n_products`` array of grade A, grade B and reject units per
+    product, from which every production and revenue total follows.
+    Takes and returns only arrays and numbers, and results for separate
+    blocks (or replications) add up, so it can fold batches in as they are
+    graded or run on stacked columns.
+    """
+    by_product = np.stack([
+        np.bincount(product_idx, weights=counts[:, j], minlength=n_products)
+        for j in (_A, _B, _REJ)
+    ])
+    cts = times[:, _FINISHED] - times[:, _CREATED]
+    cts = cts[~np.isnan(cts)]
+    return by_product, float(cts.sum()), int(cts.size)
 
 
 class MetricsCollector:
     """Accumulates every event that happens during a simulation run."""
 
-    def __init__(self, env: "simpy.Environment") -> None:
+    def __init__(self, env: "simpy.Environment", config: ConfigBundle = CONFIG,
+                 machine_capacity=None) -> None:
         self.env = env
+        self.cfg = config
+        # Machines per group (config.machines order); scenarios may override
+        # the configured counts, e.g. the kiln
+        self.machine_capacity = np.array(
+            machine_capacity if machine_capacity is not None
+            else [m.count for m in config.machines.values()],
+            dtype=float,
+        )
 
         # ── Event logs ────────────────────────────────────────────────────────
-        self.completed_batches: List[ProductionBatch]  = []
         self.orders:            List[CustomerOrder]    = []
-        self.deliveries:        List[SupplierDelivery] = []
         self.breakdowns:        List[BreakdownEvent]   = []
 
         # ── Aggregate counters ────────────────────────────────────────────────
@@ -30,106 +99,435 @@ class MetricsCollector:
         self.partial_fulfils:    int        = 0
         self.disruption_hours:   float      = 0.0
 
-        # ── Per-stage completion log: (sim_time, units_produced) ─────────────────
-        self.stage_log: Dict[str, List[Tuple[float, int]]] = {
-            s: [] for s in ["slip_prep", "casting", "demolding", "fettling", "glazing", "kiln", "finishing"]
-        }
+        # ── Demand by order day, in units (index = day the order arrived) ───
+        # Plain lists while the run is hot; read back through the
+        # ``daily_ordered_units`` / ``daily_fulfilled_units`` arrays.
+        self._daily_ord: List[float] = [0.0] * (config.sim_days + 1)
+        self._daily_ful: List[float] = [0.0] * (config.sim_days + 1)
 
-        # ── Raw-material stall log (times when production was waiting for RM) ─
-        self.stall_log: Dict[str, List[float]] = {
-            "slip_prep": [],
-            "glazing":   [],
-        }
+        # ── Per-stage completion counters, by config.machine_idx ─────────────
+        # Plain lists while the run is hot; read back through the
+        # ``stage_units`` / ``stage_batches`` arrays.
+        self._stage_units:   List[int] = [0] * len(config.machines)
+        self._stage_batches: List[int] = [0] * len(config.machines)
+
+        # ── Raw-material stall log: start / end of each wait for RM ──────────
+        # Packed doubles rather than one tuple per wait; read back through
+        # the ``stall_log`` property.
+        self._stall_start: Dict[str, array] = {"slip_prep": array("d"), "glazing": array("d")}
+        self._stall_end:   Dict[str, array] = {"slip_prep": array("d"), "glazing": array("d")}
 
-        # ── Daily snapshots (added every 24 h by daily_recorder) ─────────────
-        self.daily_snapshots: List[dict] = []
+        # ── Completed batches (struct-of-arrays, one row per finished batch) ─
+        # Sized for twice the slowest stage's nominal output over the horizon;
+        # doubled by record_batch if a run finishes more.
+        n = int(config.sim_duration * 2 * min(
+            m.count / m.proc_mean_hr for m in config.machines.values()
+        )) + 16
+        self._batch_n       = 0
+        self._graded_n      = 0   # rows whose grade columns finalize() has filled
+        self._batch_ids:    List[str] = []
+        self._batch_product = np.zeros(n, dtype=np.int16)   # index into config.product_keys
+        # Column-major, so each field the KPI reductions scan is contiguous
+        # and a pass over one column does not drag the others through cache
+        self._batch_times   = np.full((n, len(BATCH_TIME_FIELDS)), np.nan, order="F")
+        self._batch_counts  = np.zeros((n, len(BATCH_COUNT_FIELDS)), dtype=np.int64, order="F")
+        # Running reduce_batches totals over the graded rows
+        self._by_product    = np.zeros((3, len(config.product_keys)))
+        self._ct_sum:  float = 0.0
+        self._ct_n:    int   = 0
+
+        # ── Daily snapshots (one row every 24 h, written by daily_recorder) ──
+        # Struct-of-arrays, columns aligned with config.suppliers / products /
+        # machines; ``daily_snapshots`` rebuilds the per-day dicts on demand.
+        n = config.sim_days + 1
+        self._snap_n        = 0
+        self._snap_day      = np.zeros(n, dtype=np.int32)
+        self._snap_raw      = np.zeros((n, len(config.suppliers)))
+        self._snap_slip     = np.zeros(n)
+        self._snap_fg       = np.zeros((n, len(config.products)), dtype=np.int64)
+        self._snap_produced = np.zeros((n, len(config.products)), dtype=np.int64)
+        self._snap_wip      = np.zeros(n, dtype=np.int32)
+        self._snap_busy     = np.zeros((n, len(config.machines)))   # cumulative busy hours
+
+        # ── Supplier deliveries (struct-of-arrays, one row per delivery) ────
+        # Sized for two deliveries per supplier per day; doubled by
+        # record_delivery if a run receives more.  Unit cost is looked up by
+        # supplier index rather than stored per row.
+        n = config.sim_days * len(config.suppliers) * 2
+        self._deliv_n         = 0
+        self._deliv_ids:      List[str] = []
+        self._deliv_supplier  = np.zeros(n, dtype=np.int8)   # index into config.suppliers
+        self._deliv_qty       = np.zeros(n)
+        self._deliv_ordered   = np.zeros(n)
+        self._deliv_delivered = np.zeros(n)
+        self._deliv_on_time   = np.zeros(n, dtype=bool)
+        self._supplier_unit_cost = np.array(
+            [s.unit_cost_eur_t for s in config.suppliers.values()]
+        )
+
+    # A finished collector is sent back from worker processes as a plain
+    # record of the run; the SimPy environment stays behind
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["env"] = None
+        return state
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
-    def record_stage(self, stage: str, qty_units: int) -> None:
-        self.stage_log[stage].append((self.env.now, qty_units))
+    def record_stage(self, sid: int, qty_units: int) -> None:
+        """Count one batch of *qty_units* through stage *sid* (``config.machine_idx``)."""
+        self._stage_units[sid]   += qty_units
+        self._stage_batches[sid] += 1
+
+    @property
+    def stage_units(self) -> np.ndarray:
+        """Units completed per stage, aligned with ``config.machines``."""
+        return np.array(self._stage_units, dtype=np.int64)
+
+    @property
+    def stage_batches(self) -> np.ndarray:
+        """Batches completed per stage, aligned with ``config.machines``."""
+        return np.array(self._stage_batches, dtype=np.int64)
+
+    def record_order(self, order: CustomerOrder) -> None:
+        """Log a fulfilled (or stocked-out) *order* and bin its units by order day."""
+        self.orders.append(order)
+        day = int(order.created_at // self.cfg.hours_per_day)
+        if day >= len(self._daily_ord):   # horizon longer than config.sim_days
+            grow = day + 1 - len(self._daily_ord)
+            self._daily_ord.extend([0.0] * grow)
+            self._daily_ful.extend([0.0] * grow)
+        self._daily_ord[day] += order.quantity_units
+        self._daily_ful[day] += order.fulfilled_qty
+
+    @property
+    def daily_ordered_units(self) -> np.ndarray:
+        """Units ordered per day of arrival, from day 0."""
+        return np.array(self._daily_ord)
+
+    @property
+    def daily_fulfilled_units(self) -> np.ndarray:
+        """Units shipped against the orders of each arrival day, from day 0."""
+        return np.array(self._daily_ful)
+
+    def record_stall(self, stage: str, start: float, end: float) -> None:
+        """
+        Record that a slip_prep or glazing worker waited for material from *start* to *end*.
+
+        Waits are event-driven, so this runs once per get that actually
+        blocked, never per polling tick, and needs no de-bouncing.
+        """
+        self._stall_start[stage].append(start)
+        self._stall_end[stage].append(end)
+
+    @property
+    def stall_log(self) -> Dict[str, List[Tuple[float, float]]]:
+        """``(start, end)`` of every raw-material wait, by stage."""
+        return {st: list(zip(self._stall_start[st], self._stall_end[st]))
+                for st in self._stall_start}
+
+    def record_delivery(self, sid: int, qty_t: float, ordered_at: float,
+                        delivered_at: float, on_time: bool) -> None:
+        """Store one delivery from supplier *sid* (``config.supplier_idx``) as a row."""
+        i = self._deliv_n
+        if i == len(self._deliv_supplier):
+            for name in ("_deliv_supplier", "_deliv_qty", "_deliv_ordered",
+                         "_deliv_delivered", "_deliv_on_time"):
+                arr = getattr(self, name)
+                setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
+        self._deliv_supplier[i]  = sid
+        self._deliv_qty[i]       = qty_t
+        self._deliv_ordered[i]   = ordered_at
+        self._deliv_delivered[i] = delivered_at
+        self._deliv_on_time[i]   = on_time
+        self._deliv_ids.append(next_delivery_id())
+        self._deliv_n            = i + 1
 
-    def record_stall(self, stage: str) -> None:
-        """Record a 1-hour stall in slip_prep or glazing due to missing material."""
-        log = self.stall_log[stage]
-        # De-bounce: only log once per hour
-        if not log or (self.env.now - log[-1]) >= 1.0:
-            log.append(self.env.now)
+    @property
+    def deliveries(self) -> List[SupplierDelivery]:
+        """Deliveries as ``SupplierDelivery`` objects, rebuilt from the arrays."""
+        n     = self._deliv_n
+        specs = list(self.cfg.suppliers.items())
+        return [
+            SupplierDelivery(
+                delivery_id     = did,
+                supplier_name   = specs[sid][1].name,
+                material        = specs[sid][0],
+                quantity_tonnes = qty,
+                unit_cost_eur_t = specs[sid][1].unit_cost_eur_t,
+                ordered_at      = ordered,
+                delivered_at    = delivered,
+                on_time         = on_time,
+            )
+            for did, sid, qty, ordered, delivered, on_time in zip(
+                self._deliv_ids, self._deliv_supplier[:n].tolist(), self._deliv_qty[:n].tolist(),
+                self._deliv_ordered[:n].tolist(), self._deliv_delivered[:n].tolist(),
+                self._deliv_on_time[:n].tolist(),
+            )
+        ]
+
+    def record_batch(self, batch: ProductionBatch) -> None:
+        """
+        Store a finished batch as one row of the completed-batch arrays.
+
+        Only the quantity is taken from the count fields; the grade and test
+        columns are filled for all rows at once by ``finalize``.
+        """
+        i = self._batch_n
+        if i == len(self._batch_product):
+            for name in ("_batch_product", "_batch_times", "_batch_counts"):
+                arr = getattr(self, name)
+                grown = np.full_like(arr, np.nan) if arr.dtype.kind == "f" else np.zeros_like(arr)
+                setattr(self, name, np.asfortranarray(np.concatenate([arr, grown])))
+        self._batch_ids.append(batch.batch_id)
+        self._batch_product[i] = self.cfg.product_idx[batch.product]
+        self._batch_times[i]   = (                       # BATCH_TIME_FIELDS order
+            batch.created_at, batch.casting_done, batch.demolded_at, batch.fettled_at,
+            batch.glazing_done, batch.firing_done, batch.finished_at,
+        )
+        self._batch_counts[i, _QTY] = batch.quantity_units
+        self._batch_n          = i + 1
+
+    def finalize(self) -> None:
+        """
+        Apply the quality split to every batch recorded since the last call
+        and fold those rows into the running production totals.
+        """
+        lo, hi = self._graded_n, self._batch_n
+        if hi > lo:
+            self._batch_counts[lo:hi] = quality_split(self._batch_counts[lo:hi, _QTY],
+                                                      self.cfg.quality)
+            by_prod, ct_sum, ct_n = reduce_batches(
+                self._batch_counts[lo:hi], self._batch_times[lo:hi], self._batch_product[lo:hi],
+                len(self.cfg.product_keys),
+            )
+            self._by_product += by_prod
+            self._ct_sum     += ct_sum
+            self._ct_n       += ct_n
+            self._graded_n    = hi
+
+    def batch_table(self) -> np.ndarray:
+        """
+        Completed batches as one NumPy structured array.
+
+        One record per batch with ``batch_id``, ``product_idx`` and every
+        ``BATCH_TIME_FIELDS`` / ``BATCH_COUNT_FIELDS`` column; unset
+        timestamps are NaN.
+        """
+        self.finalize()
+        n   = self._batch_n
+        ids = np.array(self._batch_ids, dtype=str)
+        out = np.empty(n, dtype=[("batch_id", ids.dtype), ("product_idx", np.int16)]
+                                + [(f, np.float64) for f in BATCH_TIME_FIELDS]
+                                + [(f, np.int64) for f in BATCH_COUNT_FIELDS])
+        out["batch_id"]    = ids
+        out["product_idx"] = self._batch_product[:n]
+        for j, f in enumerate(BATCH_TIME_FIELDS):
+            out[f] = self._batch_times[:n, j]
+        for j, f in enumerate(BATCH_COUNT_FIELDS):
+            out[f] = self._batch_counts[:n, j]
+        return out
+
+    @property
+    def completed_batches(self) -> List[ProductionBatch]:
+        """Finished batches as ``ProductionBatch`` objects, rebuilt from the arrays."""
+        self.finalize()
+        n    = self._batch_n
+        keys = self.cfg.product_keys
+        out  = []
+        for bid, p, times, counts in zip(
+            self._batch_ids, self._batch_product[:n].tolist(),
+            self._batch_times[:n].tolist(), self._batch_counts[:n].tolist(),
+        ):
+            b = ProductionBatch(
+                batch_id = bid,
+                product  = keys[p],
+                **dict(zip(BATCH_TIME_FIELDS, times)),
+                **dict(zip(BATCH_COUNT_FIELDS, counts)),
+            )
+            b.finalize()
+            out.append(b)
+        return out
+
+    def record_snapshot(self, day: int, raw_mat, slip: float, fg, produced, wip: int,
+                        busy_hr) -> None:
+        """Write one day's system state; array-likes are aligned with the config tables."""
+        i = self._snap_n
+        if i == len(self._snap_day):   # horizon longer than config.sim_days
+            for name in ("_snap_day", "_snap_raw", "_snap_slip", "_snap_fg",
+                         "_snap_produced", "_snap_wip", "_snap_busy"):
+                arr = getattr(self, name)
+                setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
+        self._snap_day[i]      = day
+        self._snap_raw[i]      = raw_mat
+        self._snap_slip[i]     = slip
+        self._snap_fg[i]       = fg
+        self._snap_produced[i] = produced
+        self._snap_wip[i]      = wip
+        self._snap_busy[i]     = busy_hr
+        self._snap_n           = i + 1
+
+    def snapshot_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        The daily snapshot columns, trimmed to the recorded days.
+
+        One row per day; columns follow ``config.suppliers`` (``raw_mat``),
+        ``config.products`` (``fg``, ``produced_units``) and
+        ``config.machines`` (``busy_hr``, ``utilization``).  Arrays from
+        several replications stack directly for cross-run statistics.
+        """
+        n = self._snap_n
+        return {
+            "day":            self._snap_day[:n],
+            "raw_mat":        self._snap_raw[:n],
+            "slip":           self._snap_slip[:n],
+            "fg":             self._snap_fg[:n],
+            "produced_units": self._snap_produced[:n],
+            "wip":            self._snap_wip[:n],
+            "busy_hr":        self._snap_busy[:n],
+            "utilization":    self.utilization_trend,
+        }
+
+    @property
+    def utilization_trend(self) -> np.ndarray:
+        """Cumulative utilisation fraction per snapshot day (rows) and machine group."""
+        n       = self._snap_n
+        elapsed = self._snap_day[:n, None] * float(self.cfg.hours_per_day)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            util = self._snap_busy[:n] / (self.machine_capacity[None, :] * elapsed)
+        return np.where(elapsed > 0, np.minimum(1.0, util), 0.0)
+
+    @property
+    def daily_snapshots(self) -> List[dict]:
+        """Per-day snapshot dicts, materialised from the snapshot arrays."""
+        cfg  = self.cfg
+        n    = self._snap_n
+        mats, prods, machs = list(cfg.suppliers), list(cfg.products), list(cfg.machines)
+        return [
+            {
+                "day":            day,
+                "raw_mat":        dict(zip(mats, raw)),
+                "slip":           slip,
+                "fg":             dict(zip(prods, fg)),
+                "produced_units": dict(zip(prods, produced)),
+                "wip":            wip,
+                "utilization":    dict(zip(machs, util)),
+            }
+            for day, raw, slip, fg, produced, wip, util in zip(
+                self._snap_day[:n].tolist(), self._snap_raw[:n].tolist(),
+                self._snap_slip[:n].tolist(), self._snap_fg[:n].tolist(),
+                self._snap_produced[:n].tolist(), self._snap_wip[:n].tolist(),
+                self.utilization_trend.tolist(),
+            )
+        ]
+
+    def _stall_hours(self, stage: str) -> float:
+        """Hours during which at least one *stage* worker was stalled (union of intervals)."""
+        start = np.frombuffer(self._stall_start[stage])
+        if not start.size:
+            return 0.0
+        order = np.argsort(start, kind="stable")
+        start = start[order]
+        # Running max of the end times: a wait opens a new merged interval
+        # when it starts after everything before it has ended
+        end   = np.maximum.accumulate(np.frombuffer(self._stall_end[stage])[order])
+        first = np.flatnonzero(np.r_[True, start[1:] > end[:-1]])
+        last  = np.r_[first[1:] - 1, start.size - 1]
+        return sum((end[last] - start[first]).tolist())
 
     # ── KPI computation ───────────────────────────────────────────────────────
 
     def compute_kpis(self, sim_days: int) -> dict:
+        """
+        KPI dict for a run of *sim_days* days.
+
+        Every total is a single pass: per-product and per-machine totals
+        are one ``np.bincount`` each over an integer index column.
+        """
+        cfg       = self.cfg
+        fin       = cfg.financial
         k: dict = {}
 
         # ── Production ────────────────────────────────────────────────────────
-        batches = self.completed_batches
-        if batches:
-            total_a   = sum(b.grade_a_units for b in batches)
-            total_b   = sum(b.grade_b_units for b in batches)
-            total_rej = sum(b.reject_units  for b in batches)
+        # Already-graded batches are folded in by finalize(), so a repeat
+        # call only reduces the rows recorded since the last one
+        self.finalize()
+        n       = self._batch_n
+        by_prod = self._by_product
+        avg_ct  = self._ct_sum / self._ct_n if self._ct_n else 0.0
+        if n:
+            total_a, total_b, total_rej = map(int, by_prod.sum(axis=1).tolist())
             total_ok  = total_a + total_b
             k["total_production_units"] = total_ok
-            k["avg_daily_m2"]        = total_ok / sim_days
+            k["avg_daily_units"]        = total_ok / sim_days
             k["grade_a_units"]          = total_a
             k["grade_b_units"]          = total_b
             k["reject_units"]           = total_rej
-            k["total_batches"]       = len(batches)
-            cts = [b.cycle_time_hr for b in batches if b.cycle_time_hr is not None]
-            k["avg_cycle_time_hr"]   = sum(cts) / len(cts) if cts else 0.0
+            k["total_batches"]          = n
+            k["avg_cycle_time_hr"]      = avg_ct
         else:
-            for key in ("total_production_units", "avg_daily_m2", "grade_a_units",
+            for key in ("total_production_units", "avg_daily_units", "grade_a_units",
                         "grade_b_units", "reject_units", "total_batches", "avg_cycle_time_hr"):
                 k[key] = 0.0
 
         # Production by product
-        k["production_by_product"] = {}
-        for prod in PRODUCTS:
-            pb = [b for b in batches if b.product == prod]
-            k["production_by_product"][prod] = sum(b.saleable_units for b in pb)
+        saleable = by_prod[0] + by_prod[1]
+        k["production_by_product"] = dict(zip(cfg.product_keys, map(int, saleable.tolist())))
 
         # ── Orders ────────────────────────────────────────────────────────────
+        # Order objects are read in one pass into a float table (a pending
+        # ``fulfilled_at`` is NaN); every KPI below is an array reduction
+        # over its columns
         orders = self.orders
         if orders:
-            tot_ord  = sum(o.quantity_units    for o in orders)
-            tot_ful  = sum(o.fulfilled_qty  for o in orders)
-            complete = [o for o in orders if o.is_complete]
-            overdue  = [o for o in complete if o.is_overdue]
-
-            k["total_orders"]        = len(orders)
-            k["total_ordered_m2"]    = tot_ord
-            k["total_fulfilled_m2"]  = tot_ful
-            k["fill_rate_pct"]       = (tot_ful / tot_ord * 100) if tot_ord else 0.0
-            k["complete_pct"]        = (len(complete) / len(orders) * 100)
-            k["otd_rate_pct"]        = ((1 - len(overdue) / len(complete)) * 100
-                                        if complete else 100.0)
-            k["stockout_events"]     = len(self.stockout_events)
-            k["partial_fulfils"]     = self.partial_fulfils
-
-            lts = [(o.fulfilled_at - o.created_at) / HOURS_PER_DAY
-                   for o in orders if o.fulfilled_at is not None]
-            k["avg_lead_time_days"]  = sum(lts) / len(lts) if lts else 0.0
+            no       = len(orders)
+            qty, ful, created, ful_at, due_at, price, cust = np.array(
+                list(map(_ORDER_COLUMNS, orders)), dtype=float
+            ).T
+            cust     = cust.astype(np.int64)
+
+            tot_ord  = int(qty.sum())
+            tot_ful  = int(ful.sum())
+            complete = ful >= qty
+            n_done   = int(complete.sum())
+            n_late   = int((complete & (ful_at > due_at)).sum())   # NaN compares False
+
+            k["total_orders"]          = no
+            k["total_ordered_units"]   = tot_ord
+            k["total_fulfilled_units"] = tot_ful
+            k["fill_rate_pct"]         = (tot_ful / tot_ord * 100) if tot_ord else 0.0
+            k["complete_pct"]          = (n_done / no * 100)
+            k["otd_rate_pct"]          = ((1 - n_late / n_done) * 100
+                                          if n_done else 100.0)
+            k["stockout_events"]       = len(self.stockout_events)
+            k["partial_fulfils"]       = self.partial_fulfils
+
+            lts = (ful_at - created)[~np.isnan(ful_at)] / cfg.hours_per_day
+            k["avg_lead_time_days"]  = float(lts.mean()) if lts.size else 0.0
+
+            by_cust = np.bincount(cust, weights=ful * price, minlength=len(cfg.customers))
+            k["revenue_by_customer"] = dict(zip(cfg.customers, by_cust.tolist()))
         else:
-            for key in ("total_orders", "total_ordered_m2", "total_fulfilled_m2",
+            for key in ("total_orders", "total_ordered_units", "total_fulfilled_units",
                         "fill_rate_pct", "complete_pct", "otd_rate_pct",
                         "stockout_events", "partial_fulfils", "avg_lead_time_days"):
                 k[key] = 0.0
+            k["revenue_by_customer"] = dict.fromkeys(cfg.customers, 0.0)
 
         # ── Financial ─────────────────────────────────────────────────────────
-        rev_a = sum(
-            b.grade_a_units * PRODUCTS[b.product]["price_eur_unit"]
-            for b in batches
+        # Grade × product price table; rejects carry a zero factor
+        unit_price = np.outer(cfg.grade_price_factor, cfg.product_price)
+        rev_a, rev_b, _ = (by_prod * unit_price).sum(axis=1).tolist()
+        nd             = self._deliv_n
+        raw_mat_cost   = float(
+            (self._deliv_qty[:nd] * self._supplier_unit_cost[self._deliv_supplier[:nd]]).sum()
         )
-        rev_b = sum(
-            b.grade_b_units * PRODUCTS[b.product]["price_eur_unit"] * QUALITY["grade_b_price_factor"]
-            for b in batches
-        )
-        raw_mat_cost   = sum(d.total_cost_eur  for d in self.deliveries)
-        energy_cost    = k["total_batches"] * FINANCIAL["energy_cost_per_batch_eur"]
-        labor_cost     = (sim_days * FINANCIAL["shifts_per_day"]
-                          * FINANCIAL["labor_cost_per_shift_eur"])
-        breakdown_cost = len(self.breakdowns) * FINANCIAL["breakdown_repair_cost_eur"]
-        stockout_cost  = (sum(e["quantity_units"] for e in self.stockout_events)
-                          * FINANCIAL["stockout_penalty_eur_unit"])
+        energy_cost    = k["total_batches"] * fin["energy_cost_per_batch_eur"]
+        labor_cost     = (sim_days * fin["shifts_per_day"]
+                          * fin["labor_cost_per_shift_eur"])
+        breakdown_cost = len(self.breakdowns) * fin["breakdown_repair_cost_eur"]
+        stockout_cost  = (sum(map(_STOCKOUT_QTY, self.stockout_events))
+                          * fin["stockout_penalty_eur_unit"])
 
         total_revenue = rev_a + rev_b
         total_cost    = raw_mat_cost + energy_cost + labor_cost + breakdown_cost + stockout_cost
@@ -149,33 +547,31 @@ class MetricsCollector:
                                   if total_revenue else 0.0)
 
         # ── Machine reliability ────────────────────────────────────────────────
-        k["total_breakdowns"]   = len(self.breakdowns)
-        k["breakdown_hours"]    = sum(b.repair_duration for b in self.breakdowns)
+        bds     = self.breakdowns
+        repairs = np.fromiter(map(_REPAIR_HR, bds), float, len(bds))
+        by_mach = np.bincount(np.fromiter(map(_MACHINE_IDX, bds), np.int64, len(bds)),
+                              minlength=len(cfg.machines))
+        k["total_breakdowns"]   = len(bds)
+        k["breakdown_hours"]    = float(repairs.sum())
         k["disruption_hours"]   = self.disruption_hours
 
         # Breakdowns per machine type
-        k["breakdowns_by_machine"] = {}
-        for mkey in MACHINES:
-            k["breakdowns_by_machine"][mkey] = sum(
-                1 for b in self.breakdowns if b.machine_id == mkey
-            )
+        k["breakdowns_by_machine"] = dict(zip(cfg.machines, by_mach.tolist()))
 
         # ── Supplier performance ───────────────────────────────────────────────
-        if self.deliveries:
-            k["total_deliveries"]          = len(self.deliveries)
-            k["avg_supplier_lead_time_hr"] = (
-                sum(d.lead_time_hr for d in self.deliveries) / len(self.deliveries)
-            )
-            k["on_time_delivery_pct"] = (
-                sum(1 for d in self.deliveries if d.on_time) / len(self.deliveries) * 100
+        if nd:
+            k["total_deliveries"]          = nd
+            k["avg_supplier_lead_time_hr"] = float(
+                (self._deliv_delivered[:nd] - self._deliv_ordered[:nd]).mean()
             )
+            k["on_time_delivery_pct"]      = float(self._deliv_on_time[:nd].mean() * 100)
         else:
             k["total_deliveries"]          = 0
             k["avg_supplier_lead_time_hr"] = 0.0
             k["on_time_delivery_pct"]      = 0.0
 
         # ── Stall / raw-material shortage ────────────────────────────────────
-        k["slip_prep_stall_hrs"] = len(self.stall_log["slip_prep"])
-        k["glaze_stall_hrs"]     = len(self.stall_log["glazing"])
+        k["slip_prep_stall_hrs"] = self._stall_hours("slip_prep")
+        k["glaze_stall_hrs"]     = self._stall_hours("glazing")
 
         return k
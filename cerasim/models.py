@@ -2,30 +2,39 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional
-import uuid
+from typing import Callable, Tuple
+import itertools
+import math
 
 
-def _short_id() -> str:
-    return uuid.uuid4().hex[:8].upper()
+def _id_factory(prefix: str = "") -> Callable[[], str]:
+    """Sequential ids for one model type: *prefix* + 8 hex digits."""
+    counter = itertools.count(1)
+    return lambda: f"{prefix}{next(counter):08X}"
 
 
-@dataclass
+# Shared with MetricsCollector, which issues delivery ids as rows are
+# recorded so rebuilt SupplierDelivery objects keep them
+next_delivery_id = _id_factory("DEL-")
+
+
+@dataclass(slots=True)
 class ProductionBatch:
     """Tracks a single batch of commodes from raw material through to packaging."""
 
-    batch_id:     str   = field(default_factory=_short_id)
-    product:      str   = ""
-    quantity_units: int = 0
-    created_at:   float = 0.0          # simulation time (hours)
+    batch_id:       str   = field(default_factory=_id_factory())
+    product:        str   = ""
+    quantity_units: int   = 0
+    created_at:     float = 0.0        # simulation time (hours)
 
-    # Stage-completion timestamps (set as batch moves through pipeline)
-    casting_done:  Optional[float] = None
-    demolded_at:   Optional[float] = None
-    fettled_at:    Optional[float] = None
-    glazing_done:  Optional[float] = None
-    firing_done:   Optional[float] = None
-    finished_at:   Optional[float] = None
+    # Stage-completion timestamps (set as batch moves through pipeline;
+    # NaN until the stage is done)
+    casting_done:  float = math.nan
+    demolded_at:   float = math.nan
+    fettled_at:    float = math.nan
+    glazing_done:  float = math.nan
+    firing_done:   float = math.nan
+    finished_at:   float = math.nan
 
     # Quality outcomes (set in the finishing stage)
     grade_a_units:  int = 0
@@ -36,34 +45,39 @@ class ProductionBatch:
     leak_test_pass:  int = 0
     flush_test_pass: int = 0
 
-    @property
-    def cycle_time_hr(self) -> Optional[float]:
-        """End-to-end production time from batch creation to packaging."""
-        if self.finished_at is not None:
-            return self.finished_at - self.created_at
-        return None
+    # Derived totals, unset until finalize() runs on a graded batch
+    cycle_time_hr:  float = field(default=math.nan, init=False)
+    saleable_units: int   = field(default=0, init=False)
 
-    @property
-    def saleable_units(self) -> int:
-        return self.grade_a_units + self.grade_b_units
+    def finalize(self) -> None:
+        """Store the derived totals; call once packaging time and grades are set."""
+        self.cycle_time_hr  = self.finished_at - self.created_at
+        self.saleable_units = self.grade_a_units + self.grade_b_units
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerOrder:
     """A purchase order for commodes from a customer."""
 
-    order_id:     str   = field(default_factory=lambda: f"ORD-{_short_id()}")
-    customer:     str   = ""
-    product:      str   = ""
-    quantity_units: int = 0
-    is_express:   bool  = False
-    created_at:   float = 0.0
-    due_at:       float = 0.0
-    unit_price:   float = 0.0          # €/unit
+    order_id:       str   = field(default_factory=_id_factory("ORD-"))
+    customer_idx:   int   = -1         # index into customers
+    product:        str   = ""
+    quantity_units: int   = 0
+    is_express:     bool  = False
+    created_at:     float = 0.0
+    due_at:         float = 0.0
+    unit_price:     float = 0.0        # €/unit
 
-    # Filled in during / after fulfilment
-    fulfilled_qty: int            = 0
-    fulfilled_at:  Optional[float] = None
+    # Filled in during / after fulfilment; NaN until fulfilled
+    fulfilled_qty: int   = 0
+    fulfilled_at:  float = math.nan
+
+    # Customer names of the run's ConfigBundle (shared, not copied per order)
+    customers: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+
+    @property
+    def customer(self) -> str:
+        return self.customers[self.customer_idx] if self.customer_idx >= 0 else ""
 
     @property
     def is_complete(self) -> bool:
@@ -71,7 +85,7 @@ class CustomerOrder:
 
     @property
     def is_overdue(self) -> bool:
-        return self.fulfilled_at is not None and self.fulfilled_at > self.due_at
+        return self.fulfilled_at > self.due_at     # NaN compares False
 
     @property
     def revenue_eur(self) -> float:
@@ -82,11 +96,11 @@ class CustomerOrder:
         return min(1.0, self.fulfilled_qty / self.quantity_units) if self.quantity_units > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SupplierDelivery:
     """A raw-material delivery that arrived at the factory gate."""
 
-    delivery_id:      str   = field(default_factory=lambda: f"DEL-{_short_id()}")
+    delivery_id:      str   = field(default_factory=next_delivery_id)
     supplier_name:    str   = ""
     material:         str   = ""
     quantity_tonnes:  float = 0.0
@@ -104,11 +118,12 @@ class SupplierDelivery:
         return self.delivered_at - self.ordered_at
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakdownEvent:
     """A machine failure and subsequent repair."""
 
     machine_id:      str   = ""
+    machine_idx:     int   = -1     # index into config.machines
     machine_name:    str   = ""
     occurred_at:     float = 0.0    # simulation time when failure occurred
     repair_duration: float = 0.0    # hours until back online
@@ -5,23 +5,22 @@ Rich console output and Matplotlib dashboard generation.
 from __future__ import annotations
 
 import os
+import re
+import threading
 from typing import Dict, Tuple
 
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 import numpy as np
-from rich import box
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
 from .config import (
     FACTORY_EMPLOYEES, FACTORY_FOUNDED, FACTORY_LOCATION, FACTORY_NAME,
     MACHINES, PRODUCTS, SCENARIOS, SUPPLIERS, SIM_DAYS,
 )
+from .config_arrays import (
+    BODY_KG, BODY_MATERIALS, COMP_VEC, GLAZE_KG, GRADE_PRICE_FACTOR, PRODUCT_PRICE,
+    SUPPLIER_IDX, SUPPLIER_UNIT_COST,
+)
 
 console = Console()
 
@@ -33,6 +32,18 @@ SCENARIO_COLORS = {
     "demand_surge":      "#F4A261",
     "optimised":         "#2EC4B6",
 }
+SCENARIO_LABELS = {sid: SCENARIOS[sid]["label"] for sid in SCENARIOS}
+
+# Raw-material cost per unit of each product (€, aligned with PRODUCT_KEYS;
+# body minerals plus glaze at the suppliers' prices) — the dashboard's
+# cost line counts raw material only, for clarity
+_BODY_EUR_KG   = COMP_VEC @ SUPPLIER_UNIT_COST[[SUPPLIER_IDX[m] for m in BODY_MATERIALS]] / 1000
+_GLAZE_EUR_KG  = SUPPLIER_UNIT_COST[SUPPLIER_IDX["glaze"]] / 1000
+_UNIT_MAT_COST = BODY_KG * _BODY_EUR_KG + GLAZE_KG * _GLAZE_EUR_KG
+
+# PNG encoder settings: the reports are written once and read from disk, so
+# trade ~13 % larger files for a much cheaper zlib pass
+_PNG_FAST = {"compress_level": 1, "optimize": False}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -55,105 +66,130 @@ def print_banner() -> None:
 # Per-scenario KPI summary
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Tables are pre-formatted into one markup string per print: Rich only
+# applies the colours, with no per-cell measuring or wrapping.  The tags
+# are stripped to measure a cell's printed width.
+_MARKUP = re.compile(r"\[/?[a-z #0-9]*\]")
+
+
+def _rjust(cell: str, width: int) -> str:
+    """Right-align *cell* to *width* printed columns, ignoring its markup."""
+    return " " * (width - len(_MARKUP.sub("", cell))) + cell
+
+
+# Opening / closing markup for good (≥ threshold), fair (≥ 75 %) and poor rates
+_GOOD = ("[green]",  "[/green]")
+_FAIR = ("[yellow]", "[/yellow]")
+_POOR = ("[red]",    "[/red]")
+
+
+def _pct(v: float, good_above: float = 90) -> str:
+    """A percentage coloured by how it compares with *good_above* and 75 %."""
+    open_, close = _GOOD if v >= good_above else (_FAIR if v >= 75 else _POOR)
+    return f"{open_}{v:.1f}%{close}"
+
+
+# Comparison-table cell formatters by row kind
+_CELL_FORMAT = {"pct": _pct, "f2": "{:.2f}".format, ",": "{:,.0f}".format}
+
+
 def print_kpi_table(scenario_id: str, kpis: dict) -> None:
     scen = SCENARIOS[scenario_id]
     title = f"[bold]{scen['label']}[/bold]  —  {scen['description']}"
     console.rule(title)
 
-    t = Table(box=box.SIMPLE_HEAD, show_header=True, header_style="bold magenta")
-    t.add_column("KPI",        style="cyan",  min_width=32)
-    t.add_column("Value",      style="white", justify="right", min_width=16)
-    t.add_column("Assessment", style="dim",   min_width=20)
-
-    def row(label, value, assessment=""):
-        t.add_row(label, value, assessment)
-
-    def pct_style(v, good_above=90):
-        colour = "green" if v >= good_above else ("yellow" if v >= 75 else "red")
-        return f"[{colour}]{v:.1f}%[/{colour}]"
-
-    # Production
-    row("── Production ──────────────────", "", "")
-    row("  Total output (units)",
-        f"{kpis['total_production_units']:>12,.0f}",
-        f"avg {kpis['avg_daily_m2']:,.0f} units/day")
-    row("  Grade A (units)",
-        f"{kpis['grade_a_units']:>12,.0f}",
-        f"{kpis['grade_a_units']/max(1,kpis['total_production_units'])*100:.1f}% of total")
-    row("  Grade B / Seconds (units)",
-        f"{kpis['grade_b_units']:>12,.0f}", "")
-    row("  Scrap (units)",
-        f"{kpis['reject_units']:>12,.0f}", "")
-    row("  Avg batch cycle time",
-        f"{kpis['avg_cycle_time_hr']:>10.1f} h", "")
-    row("  Total batches completed",
-        f"{kpis['total_batches']:>12,d}", "")
-
-    # Orders
-    row("── Orders ──────────────────────", "", "")
-    row("  Orders received",
-        f"{kpis['total_orders']:>12,d}", "")
-    row("  Total demand (units)",
-        f"{kpis['total_ordered_m2']:>12,.0f}", "")
-    row("  Quantity fill rate",
-        pct_style(kpis['fill_rate_pct']), "")
-    row("  Order completion rate",
-        pct_style(kpis['complete_pct']), "")
-    row("  On-time delivery rate",
-        pct_style(kpis['otd_rate_pct']), "")
-    row("  Avg customer lead time",
-        f"{kpis['avg_lead_time_days']:>10.2f} days", "")
-    row("  Stockout events",
-        f"{kpis['stockout_events']:>12,d}",
-        "[red]critical[/red]" if kpis["stockout_events"] > 10 else "")
-    row("  Partial fulfilments",
-        f"{kpis['partial_fulfils']:>12,d}", "")
-
-    # Machines
-    row("── Reliability ─────────────────", "", "")
-    row("  Total breakdowns",
-        f"{kpis['total_breakdowns']:>12,d}", "")
-    row("  Total downtime (h)",
-        f"{kpis['breakdown_hours']:>10.1f} h",
-        f"{kpis['breakdown_hours']/max(1,SIM_DAYS*24)*100:.1f}% of sim time")
-    row("  Kaolin disruption hrs",
-        f"{kpis['disruption_hours']:>10.1f} h", "")
-    row("  Body-prep stall hrs",
-        f"{kpis['slip_prep_stall_hrs']:>12,d}", "")
-    row("  Glaze-line stall hrs",
-        f"{kpis['glaze_stall_hrs']:>12,d}", "")
-
-    # Supplier
-    row("── Supply chain ────────────────", "", "")
-    row("  Total deliveries received",
-        f"{kpis['total_deliveries']:>12,d}", "")
-    row("  Avg supplier lead time",
-        f"{kpis['avg_supplier_lead_time_hr']:>10.1f} h", "")
-    row("  On-time delivery rate",
-        pct_style(kpis['on_time_delivery_pct']), "")
-
-    # Financial
-    row("── Financial (90-day) ──────────", "", "")
-    row("  Revenue",
-        f"€{kpis['revenue_eur']:>14,.0f}", "")
-    row("  Raw material cost",
-        f"€{kpis['raw_mat_cost_eur']:>14,.0f}", "")
-    row("  Energy cost",
-        f"€{kpis['energy_cost_eur']:>14,.0f}", "")
-    row("  Labour cost",
-        f"€{kpis['labor_cost_eur']:>14,.0f}", "")
-    row("  Breakdown cost",
-        f"€{kpis['breakdown_cost_eur']:>14,.0f}", "")
-    row("  Stockout penalty",
-        f"€{kpis['stockout_cost_eur']:>14,.0f}", "")
-    row("  Gross profit",
-        f"€{kpis['gross_profit_eur']:>14,.0f}",
-        f"margin {kpis['gross_margin_pct']:.1f}%")
-    row("  Net profit",
-        f"€{kpis['net_profit_eur']:>14,.0f}",
-        f"margin {kpis['net_margin_pct']:.1f}%")
-
-    console.print(t)
+    lines = [
+        f"  [bold magenta]{'KPI':<34} {'Value':>16}   Assessment[/bold magenta]",
+        " " + "─" * 76,
+    ]
+
+    rows = [
+        # Production
+        ("── Production ──────────────────", "", ""),
+        ("  Total output (units)",
+            f"{kpis['total_production_units']:>12,.0f}",
+            f"avg {kpis['avg_daily_units']:,.0f} units/day"),
+        ("  Grade A (units)",
+            f"{kpis['grade_a_units']:>12,.0f}",
+            f"{kpis['grade_a_units']/max(1,kpis['total_production_units'])*100:.1f}% of total"),
+        ("  Grade B / Seconds (units)",
+            f"{kpis['grade_b_units']:>12,.0f}", ""),
+        ("  Scrap (units)",
+            f"{kpis['reject_units']:>12,.0f}", ""),
+        ("  Avg batch cycle time",
+            f"{kpis['avg_cycle_time_hr']:>10.1f} h", ""),
+        ("  Total batches completed",
+            f"{kpis['total_batches']:>12,d}", ""),
+
+        # Orders
+        ("── Orders ──────────────────────", "", ""),
+        ("  Orders received",
+            f"{kpis['total_orders']:>12,d}", ""),
+        ("  Total demand (units)",
+            f"{kpis['total_ordered_units']:>12,.0f}", ""),
+        ("  Quantity fill rate",
+            _pct(kpis['fill_rate_pct']), ""),
+        ("  Order completion rate",
+            _pct(kpis['complete_pct']), ""),
+        ("  On-time delivery rate",
+            _pct(kpis['otd_rate_pct']), ""),
+        ("  Avg customer lead time",
+            f"{kpis['avg_lead_time_days']:>10.2f} days", ""),
+        ("  Stockout events",
+            f"{kpis['stockout_events']:>12,d}",
+            "[red]critical[/red]" if kpis["stockout_events"] > 10 else ""),
+        ("  Partial fulfilments",
+            f"{kpis['partial_fulfils']:>12,d}", ""),
+
+        # Machines
+        ("── Reliability ─────────────────", "", ""),
+        ("  Total breakdowns",
+            f"{kpis['total_breakdowns']:>12,d}", ""),
+        ("  Total downtime (h)",
+            f"{kpis['breakdown_hours']:>10.1f} h",
+            f"{kpis['breakdown_hours']/max(1,SIM_DAYS*24)*100:.1f}% of sim time"),
+        ("  Kaolin disruption hrs",
+            f"{kpis['disruption_hours']:>10.1f} h", ""),
+        ("  Body-prep stall hrs",
+            f"{kpis['slip_prep_stall_hrs']:>10,.1f} h", ""),
+        ("  Glaze-line stall hrs",
+            f"{kpis['glaze_stall_hrs']:>10,.1f} h", ""),
+
+        # Supplier
+        ("── Supply chain ────────────────", "", ""),
+        ("  Total deliveries received",
+            f"{kpis['total_deliveries']:>12,d}", ""),
+        ("  Avg supplier lead time",
+            f"{kpis['avg_supplier_lead_time_hr']:>10.1f} h", ""),
+        ("  On-time delivery rate",
+            _pct(kpis['on_time_delivery_pct']), ""),
+
+        # Financial
+        ("── Financial (90-day) ──────────", "", ""),
+        ("  Revenue",
+            f"€{kpis['revenue_eur']:>14,.0f}", ""),
+        ("  Raw material cost",
+            f"€{kpis['raw_mat_cost_eur']:>14,.0f}", ""),
+        ("  Energy cost",
+            f"€{kpis['energy_cost_eur']:>14,.0f}", ""),
+        ("  Labour cost",
+            f"€{kpis['labor_cost_eur']:>14,.0f}", ""),
+        ("  Breakdown cost",
+            f"€{kpis['breakdown_cost_eur']:>14,.0f}", ""),
+        ("  Stockout penalty",
+            f"€{kpis['stockout_cost_eur']:>14,.0f}", ""),
+        ("  Gross profit",
+            f"€{kpis['gross_profit_eur']:>14,.0f}",
+            f"margin {kpis['gross_margin_pct']:.1f}%"),
+        ("  Net profit",
+            f"€{kpis['net_profit_eur']:>14,.0f}",
+            f"margin {kpis['net_margin_pct']:.1f}%"),
+    ]
+    for label, value, assessment in rows:
+        line = f"  [cyan]{label:<34}[/cyan] {_rjust(value, 16)}"
+        lines.append(f"{line}   [dim]{assessment}[/dim]" if assessment else line)
+
+    console.print("\n".join(lines), highlight=False)
     console.print()
 
 
@@ -161,59 +197,57 @@ def print_kpi_table(scenario_id: str, kpis: dict) -> None:
 # Cross-scenario comparison table
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Column headers per scenario: opening style markup and the label wrapped
+# onto two lines at its last word break, so four scenarios fit in 80 columns
+_SCENARIO_HEADS: Dict[str, Tuple[str, Tuple[str, str]]] = {
+    sid: (f"[bold {SCENARIO_COLORS.get(sid, 'white')}]",
+          (" ".join(words[:-1]), words[-1]))
+    for sid, words in ((sid, label.split()) for sid, label in SCENARIO_LABELS.items())
+}
+
 def print_comparison_table(results: Dict[str, Tuple]) -> None:
     console.rule("[bold yellow]Scenario Comparison (90-day summary)[/bold yellow]")
 
-    t = Table(box=box.DOUBLE_EDGE, show_header=True, header_style="bold yellow")
-    t.add_column("Metric", style="cyan", min_width=30)
-
-    scen_ids = list(results.keys())
-    for sid in scen_ids:
-        colour = SCENARIO_COLORS.get(sid, "white")
-        t.add_column(
-            Text(SCENARIOS[sid]["label"], style=f"bold {colour}"),
-            justify="right", min_width=16,
-        )
-
-    def _fmt(v, fmt=","):
-        if isinstance(v, float):
-            if fmt == "pct":
-                colour = "green" if v >= 90 else ("yellow" if v >= 75 else "red")
-                return f"[{colour}]{v:.1f}%[/{colour}]"
-            return f"{v:,.0f}"
-        return str(v)
-
+    scen_ids  = list(results.keys())
     kpis_list = [results[s][1] for s in scen_ids]
 
     rows = [
-        ("Output (units)",          "total_production_m2",  ","),
-        ("Avg daily output (units)", "avg_daily_m2",          ","),
-        ("Fill rate",            "fill_rate_pct",         "pct"),
-        ("On-time delivery",     "otd_rate_pct",          "pct"),
-        ("Avg lead time (days)", "avg_lead_time_days",    "f2"),
-        ("Stockout events",      "stockout_events",        ","),
-        ("Total breakdowns",     "total_breakdowns",       ","),
-        ("Downtime (h)",         "breakdown_hours",        ","),
-        ("Revenue (€)",          "revenue_eur",            ","),
-        ("Net profit (€)",       "net_profit_eur",         ","),
-        ("Net margin",           "net_margin_pct",        "pct"),
-        ("Kaolin stall (h)",     "disruption_hours",       ","),
+        ("Output (units)",           "total_production_units",   ","),
+        ("Avg daily output (units)", "avg_daily_units",          ","),
+        ("Fill rate",                "fill_rate_pct",          "pct"),
+        ("On-time delivery",         "otd_rate_pct",           "pct"),
+        ("Avg lead time (days)",     "avg_lead_time_days",      "f2"),
+        ("Stockout events",          "stockout_events",          ","),
+        ("Total breakdowns",         "total_breakdowns",         ","),
+        ("Downtime (h)",             "breakdown_hours",          ","),
+        ("Revenue (€)",              "revenue_eur",              ","),
+        ("Net profit (€)",           "net_profit_eur",           ","),
+        ("Net margin",               "net_margin_pct",         "pct"),
+        ("Kaolin stall (h)",         "disruption_hours",         ","),
     ]
 
-    for label, key, fmt in rows:
-        vals = []
-        for k in kpis_list:
-            v = k.get(key, 0)
-            if fmt == "pct":
-                colour = "green" if v >= 90 else ("yellow" if v >= 75 else "red")
-                vals.append(f"[{colour}]{v:.1f}%[/{colour}]")
-            elif fmt == "f2":
-                vals.append(f"{v:.2f}")
-            else:
-                vals.append(f"{v:,.0f}")
-        t.add_row(label, *vals)
-
-    console.print(t)
+    # One (metric × scenario) pass over the KPI dicts, then each row is
+    # formatted with its kind's formatter
+    vals  = np.array([[k.get(key, 0) for k in kpis_list] for _, key, _ in rows], dtype=float)
+    cells = [list(map(_CELL_FORMAT[fmt], row)) for (_, _, fmt), row in zip(rows, vals.tolist())]
+
+    # Column widths from the content and the wrapped scenario labels
+    label_w = max(len(label) for label, _, _ in rows)
+    heads   = [_SCENARIO_HEADS[sid] for sid in scen_ids]
+    col_w   = max(max(len(h) for _, pair in heads for h in pair),
+                  max(len(_MARKUP.sub("", c)) for vals in cells for c in vals))
+
+    lines = []
+    for i in range(2):
+        hdr = "   ".join(f"{style}{pair[i]:>{col_w}}[/]" for style, pair in heads)
+        first = "Metric" if i else ""
+        lines.append(f"  [bold yellow]{first:<{label_w}}[/bold yellow]   {hdr}")
+    lines.append(" " + "─" * (label_w + (col_w + 3) * len(scen_ids) + 2))
+    for (label, _, _), vals in zip(rows, cells):
+        lines.append(f"  [cyan]{label:<{label_w}}[/cyan]   "
+                     + "   ".join(_rjust(c, col_w) for c in vals))
+
+    console.print("\n".join(lines), highlight=False)
     console.print()
 
 
@@ -221,6 +255,21 @@ def print_comparison_table(results: Dict[str, Tuple]) -> None:
 # Matplotlib dashboard
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _new_figure(figsize: Tuple[float, float]):
+    """
+    An Agg-backed, constrained-layout figure.
+
+    Matplotlib is imported here rather than at module load, so the console
+    tables (and ``--no-charts`` runs) never pay for its import.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, layout="constrained")
+    FigureCanvasAgg(fig)
+    return fig
+
+
 def _style_ax(ax, title):
     ax.set_title(title, fontsize=9, fontweight="bold", pad=6)
     ax.tick_params(labelsize=7)
@@ -229,148 +278,227 @@ def _style_ax(ax, title):
     ax.grid(axis="y", alpha=0.3)
 
 
-def plot_scenario_dashboard(factory, kpis: dict, scenario_id: str, out_dir: str) -> str:
+_WEEK = np.ones(7, dtype=np.int64)   # rolling-window kernel
+
+
+def _rolling_fill_rate(daily_ord: np.ndarray, daily_ful: np.ndarray) -> np.ndarray:
+    """7-day rolling quantity fill rate (%) by order day, ``SIM_DAYS + 1`` long."""
+    # Daily unit counts are whole numbers, so the trailing 7-day sums are
+    # exact as an integer convolution with a week of ones
+    n          = SIM_DAYS + 1
+    window_ord = np.convolve(daily_ord[:n].astype(np.int64), _WEEK)[:n]
+    window_ful = np.convolve(daily_ful[:n].astype(np.int64), _WEEK)[:n]
+    return np.divide(window_ful * 100, window_ord,
+                     out=np.full(len(window_ord), 100.0), where=window_ord > 0)
+
+
+def _cumulative_rev_cost(table: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Generate a 3×2 matplotlib dashboard for a single scenario.
-    Returns the saved file path.
+    ``(days, revenue, raw-material cost)`` running totals in batch finish
+    order, from a ``MetricsCollector.batch_table()``.
     """
-    snaps = factory.metrics.daily_snapshots
-    if not snaps:
-        return ""
+    order    = np.argsort(table["finished_at"], kind="stable")
+    batches  = table[order]
+    idx      = batches["product_idx"]
+    saleable = batches["grade_a_units"] + batches["grade_b_units"] * GRADE_PRICE_FACTOR[1]
+    cum_rev  = np.cumsum(saleable * PRODUCT_PRICE[idx])
+    cum_cost = np.cumsum(batches["quantity_units"] * _UNIT_MAT_COST[idx])
+    return batches["finished_at"] / 24, cum_rev, cum_cost
 
-    days         = [s["day"]   for s in snaps]
-    mat_names    = list(SUPPLIERS.keys())
-    prod_names   = list(PRODUCTS.keys())
 
-    fig, axes = plt.subplots(2, 3, figsize=(15, 8))
-    fig.suptitle(
-        f"{FACTORY_NAME}  ·  {SCENARIOS[scenario_id]['label']}\n"
-        f"{SCENARIOS[scenario_id]['description']}",
-        fontsize=11, fontweight="bold", y=1.01,
-    )
-    plt.subplots_adjust(hspace=0.45, wspace=0.35)
-
-    # ── (0,0) Raw material inventory ──────────────────────────────────────
-    ax = axes[0][0]
-    mat_colors = ["#8B4513", "#DAA520", "#708090", "#4682B4", "#48A999"]
-    for mat, col in zip(mat_names, mat_colors):
-        vals = [s["raw_mat"][mat] for s in snaps]
-        ax.plot(days, vals, label=mat.capitalize(), color=col, linewidth=1.4)
-        reorder = SUPPLIERS[mat]["reorder_point_t"]
-        ax.axhline(reorder, color=col, linewidth=0.6, linestyle="--", alpha=0.5)
-
-    # Mark kaolin disruption
-    disruption = SCENARIOS[scenario_id]["kaolin_disruption"]
-    if disruption:
-        d_s = disruption[0] / 24
-        d_e = disruption[1] / 24
-        ax.axvspan(d_s, d_e, color="#E63946", alpha=0.12, label="Disruption")
-
-    ax.set_ylabel("Stock (tonnes)", fontsize=8)
-    ax.set_xlabel("Day", fontsize=8)
-    ax.legend(fontsize=6, ncol=2, loc="upper right")
-    _style_ax(ax, "Raw Material Inventory")
-
-    # ── (0,1) Daily production by product ──────────────────────────────────
-    ax = axes[0][1]
-    bottom = np.zeros(len(days))
-    for prod in prod_names:
-        vals = np.array([s["produced_m2"].get(prod, 0) for s in snaps])
-        ax.bar(days, vals, bottom=bottom,
-               color=PRODUCT_COLORS[prod], label=prod, alpha=0.85, width=0.9)
-        bottom += vals
-    ax.set_ylabel("units / day", fontsize=8)
-    ax.set_xlabel("Day", fontsize=8)
-    ax.legend(fontsize=6, loc="lower right")
-    _style_ax(ax, "Daily Production by Product")
-
-    # ── (0,2) Finished-goods warehouse levels ───────────────────────────────
-    ax = axes[0][2]
-    for prod in prod_names:
-        vals = [s["fg"][prod] for s in snaps]
-        ax.plot(days, vals, color=PRODUCT_COLORS[prod],
-                label=prod, linewidth=1.4)
-    ax.set_ylabel("Stock (units)", fontsize=8)
-    ax.set_xlabel("Day", fontsize=8)
-    ax.legend(fontsize=6)
-    _style_ax(ax, "Finished-Goods Warehouse")
-
-    # ── (1,0) Machine utilisation (final cumulative) ────────────────────────
-    ax = axes[1][0]
-    final_util = snaps[-1]["utilization"]
-    mach_labels = [MACHINES[k]["name"].replace(" ", "\n") for k in MACHINES]
-    util_vals   = [final_util.get(k, 0) * 100 for k in MACHINES]
-    bar_cols    = ["#2E86AB", "#A23B72", "#F18F01", "#E63946", "#2EC4B6"]
-    bars = ax.barh(mach_labels, util_vals, color=bar_cols, alpha=0.85)
-    ax.axvline(85, color="red", linewidth=1.0, linestyle="--", alpha=0.7, label="85 % threshold")
-    ax.set_xlim(0, 105)
-    ax.set_xlabel("Utilisation (%)", fontsize=8)
-    for bar, v in zip(bars, util_vals):
-        ax.text(v + 1, bar.get_y() + bar.get_height() / 2,
-                f"{v:.0f}%", va="center", fontsize=7)
-    ax.legend(fontsize=6)
-    _style_ax(ax, "Machine Utilisation (cumulative)")
-
-    # ── (1,1) Rolling 7-day order fill rate ────────────────────────────────
-    ax = axes[1][1]
-    orders = factory.metrics.orders
-    if orders:
-        # Bin fulfilled units and ordered units by day
-        daily_ord  = np.zeros(SIM_DAYS + 1)
-        daily_ful  = np.zeros(SIM_DAYS + 1)
-        for o in orders:
-            d = int(o.created_at / 24)
-            if d <= SIM_DAYS:
-                daily_ord[d] += o.quantity_m2
-                daily_ful[d] += o.fulfilled_qty
-
-        rolling_rate = []
-        for i in range(len(daily_ord)):
-            window_ord = daily_ord[max(0, i-6):i+1].sum()
-            window_ful = daily_ful[max(0, i-6):i+1].sum()
-            rolling_rate.append(
-                (window_ful / window_ord * 100) if window_ord > 0 else 100.0
-            )
-        ax.plot(range(len(rolling_rate)), rolling_rate,
-                color=SCENARIO_COLORS[scenario_id], linewidth=1.6)
+class _DashboardTemplate:
+    """
+    The 2×3 scenario dashboard, built once and re-filled for each scenario.
+
+    Axes, labels, reference lines and legends are drawn in ``__init__``
+    for a horizon of *n_days* snapshots; ``update`` only swaps in one
+    scenario's data on the existing artists.  Disruption spans and the
+    filled areas (production stack, gross-profit band) vary in shape per
+    scenario, so they are redrawn.
+    """
+
+    def __init__(self, n_days: int) -> None:
+        self.n_days = n_days
+        days        = np.arange(1, n_days + 1)
+        zeros       = np.zeros(n_days)
+        mat_names   = list(SUPPLIERS.keys())
+        prod_names  = list(PRODUCTS.keys())
+
+        fig  = _new_figure((15, 8))
+        axes = fig.subplots(2, 3)
+        self.fig   = fig
+        self.axes  = axes
+        self.title = fig.suptitle("", fontsize=11, fontweight="bold")
+
+        # ── (0,0) Raw material inventory ──────────────────────────────────
+        ax = axes[0][0]
+        mat_colors = ["#8B4513", "#DAA520", "#708090", "#4682B4", "#48A999"]
+        self.raw_lines = []
+        for mat, col in zip(mat_names, mat_colors):
+            line, = ax.plot(days, zeros, label=mat.capitalize(), color=col, linewidth=1.4)
+            self.raw_lines.append(line)
+            reorder = SUPPLIERS[mat]["reorder_point_t"]
+            ax.axhline(reorder, color=col, linewidth=0.6, linestyle="--", alpha=0.5)
+        self.spans = []
+        ax.set_ylabel("Stock (tonnes)", fontsize=8)
+        ax.set_xlabel("Day", fontsize=8)
+        _style_ax(ax, "Raw Material Inventory")
+
+        # ── (0,1) Daily production by product ──────────────────────────────
+        ax = axes[0][1]
+        self.prod_colors = [PRODUCT_COLORS[prod] for prod in prod_names]
+        self.prod_stack  = ax.stackplot(days, np.zeros((len(prod_names), n_days)),
+                                        labels=prod_names, colors=self.prod_colors, alpha=0.85,
+                                        step="mid")
+        ax.set_ylabel("units / day", fontsize=8)
+        ax.set_xlabel("Day", fontsize=8)
+        ax.legend(fontsize=6, loc="lower right")
+        _style_ax(ax, "Daily Production by Product")
+
+        # ── (0,2) Finished-goods warehouse levels ───────────────────────────
+        ax = axes[0][2]
+        self.fg_lines = [
+            ax.plot(days, zeros, color=PRODUCT_COLORS[prod], label=prod, linewidth=1.4)[0]
+            for prod in prod_names
+        ]
+        ax.set_ylabel("Stock (units)", fontsize=8)
+        ax.set_xlabel("Day", fontsize=8)
+        ax.legend(fontsize=6)
+        _style_ax(ax, "Finished-Goods Warehouse")
+
+        # ── (1,0) Machine utilisation (final cumulative) ────────────────────
+        ax = axes[1][0]
+        mach_labels = [MACHINES[k]["name"].replace(" ", "\n") for k in MACHINES]
+        bar_cols    = ["#2E86AB", "#A23B72", "#F18F01", "#E63946", "#2EC4B6"]
+        self.util_bars  = ax.barh(mach_labels, np.zeros(len(mach_labels)),
+                                  color=bar_cols, alpha=0.85)
+        self.util_texts = [
+            ax.text(0, bar.get_y() + bar.get_height() / 2, "", va="center", fontsize=7)
+            for bar in self.util_bars
+        ]
+        ax.axvline(85, color="red", linewidth=1.0, linestyle="--", alpha=0.7, label="85 % threshold")
+        ax.set_xlim(0, 105)
+        ax.set_xlabel("Utilisation (%)", fontsize=8)
+        ax.legend(fontsize=6)
+        _style_ax(ax, "Machine Utilisation (cumulative)")
+
+        # ── (1,1) Rolling 7-day order fill rate ────────────────────────────
+        ax = axes[1][1]
+        self.fill_line, = ax.plot([], [], linewidth=1.6)
         ax.axhline(95, color="green", linewidth=0.8, linestyle="--", alpha=0.6, label="95% target")
+        ax.set_xlim(-0.05 * SIM_DAYS, 1.05 * SIM_DAYS)
         ax.set_ylim(0, 105)
         ax.set_ylabel("Fill rate (%)", fontsize=8)
         ax.set_xlabel("Day", fontsize=8)
         ax.legend(fontsize=6)
-    _style_ax(ax, "7-day Rolling Order Fill Rate")
-
-    # ── (1,2) Cumulative revenue vs cost ───────────────────────────────────
-    ax = axes[1][2]
-    batches = factory.metrics.completed_batches
-    if batches:
-        # Sort by finished_at
-        sorted_b = sorted(batches, key=lambda b: b.finished_at or 0)
-        times    = [(b.finished_at or 0) / 24 for b in sorted_b]
-        cum_rev  = np.cumsum([
-            b.grade_a_m2 * PRODUCTS[b.product]["price_eur_m2"] +
-            b.grade_b_m2 * PRODUCTS[b.product]["price_eur_m2"] * 0.65
-            for b in sorted_b
-        ])
-        # Approximate cumulative cost (raw mat only — for clarity)
-        cum_cost = np.cumsum([
-            b.quantity_m2 * 2.40   # approx €/units raw material (see config comments)
-            for b in sorted_b
-        ])
-        ax.fill_between(times, cum_rev / 1e6, cum_cost / 1e6,
-                        alpha=0.25, color="green", label="Gross profit")
-        ax.plot(times, cum_rev  / 1e6, color="#2EC4B6",  linewidth=1.5, label="Revenue")
-        ax.plot(times, cum_cost / 1e6, color="#E63946",  linewidth=1.5, linestyle="--",
-                label="Raw mat. cost")
+        _style_ax(ax, "7-day Rolling Order Fill Rate")
+
+        # ── (1,2) Cumulative revenue vs cost ───────────────────────────────
+        ax = axes[1][2]
+        self.profit_band = ax.fill_between([], [], [], alpha=0.25, color="green",
+                                           label="Gross profit")
+        self.rev_line,  = ax.plot([], [], color="#2EC4B6", linewidth=1.5, label="Revenue")
+        self.cost_line, = ax.plot([], [], color="#E63946", linewidth=1.5, linestyle="--",
+                                  label="Raw mat. cost")
         ax.set_ylabel("€ millions", fontsize=8)
         ax.set_xlabel("Day", fontsize=8)
         ax.legend(fontsize=6)
-    _style_ax(ax, "Cumulative Revenue vs. Raw Material Cost")
+        _style_ax(ax, "Cumulative Revenue vs. Raw Material Cost")
+
+    def update(self, metrics, snaps: Dict[str, np.ndarray], scenario_id: str) -> None:
+        """Fill the figure with *scenario_id*'s run (*snaps*: its ``snapshot_arrays()``)."""
+        scen  = SCENARIOS[scenario_id]
+        days  = snaps["day"]
+        axes  = self.axes
+        self.title.set_text(f"{FACTORY_NAME}  ·  {scen['label']}\n{scen['description']}")
+
+        # Raw materials, with this scenario's supplier disruptions marked
+        ax = axes[0][0]
+        for line, col in zip(self.raw_lines, snaps["raw_mat"].T):
+            line.set_data(days, col)
+        for span in self.spans:
+            span.remove()
+        self.spans = [
+            ax.axvspan(d.start_hr / 24, d.end_hr / 24, color="#E63946", alpha=0.12,
+                       label="Disruption" if i == 0 else None)
+            for i, d in enumerate(scen["disruptions"])
+        ]
+        ax.legend(fontsize=6, ncol=2, loc="upper right")
+        ax.relim()
+        ax.autoscale_view()
+
+        # Daily production, stacked; one polygon per product, redrawn
+        ax = axes[0][1]
+        for poly in self.prod_stack:
+            poly.remove()
+        self.prod_stack = ax.stackplot(days, snaps["produced_units"].T,
+                                       colors=self.prod_colors, alpha=0.85, step="mid")
+        ax.relim()
+        ax.autoscale_view()
+
+        # Finished goods
+        ax = axes[0][2]
+        for line, col in zip(self.fg_lines, snaps["fg"].T):
+            line.set_data(days, col)
+        ax.relim()
+        ax.autoscale_view()
+
+        # Utilisation on the last day
+        final_util = snaps["utilization"][-1] * 100
+        for bar, text, v in zip(self.util_bars, self.util_texts, final_util.tolist()):
+            bar.set_width(v)
+            text.set_x(v + 1)
+            text.set_text(f"{v:.0f}%")
+
+        # Rolling fill rate
+        orders = metrics.orders
+        self.fill_line.set_visible(bool(orders))
+        if orders:
+            rate = _rolling_fill_rate(metrics.daily_ordered_units,
+                                      metrics.daily_fulfilled_units)
+            self.fill_line.set_data(range(len(rate)), rate)
+            self.fill_line.set_color(SCENARIO_COLORS[scenario_id])
+
+        # Cumulative revenue vs cost; the band is redrawn as its polygon
+        # changes shape with the batch count
+        ax = axes[1][2]
+        self.profit_band.remove()
+        times, cum_rev, cum_cost = _cumulative_rev_cost(metrics.batch_table())
+        self.profit_band = ax.fill_between(times, cum_rev / 1e6, cum_cost / 1e6,
+                                           alpha=0.25, color="green")
+        self.rev_line.set_data(times, cum_rev / 1e6)
+        self.cost_line.set_data(times, cum_cost / 1e6)
+        ax.relim()
+        ax.autoscale_view()
+
+
+# One template per snapshot count, reused for every scenario of that
+# horizon.  Artists are not thread-safe, so each thread keeps its own;
+# render a run's dashboards on one thread to get the reuse.
+_local = threading.local()
+
+
+def plot_scenario_dashboard(metrics, kpis: dict, scenario_id: str, out_dir: str) -> str:
+    """
+    Generate a 3×2 matplotlib dashboard for a single scenario from its
+    run's ``MetricsCollector``.  Returns the saved file path.
+    """
+    snaps  = metrics.snapshot_arrays()
+    n_days = len(snaps["day"])
+    if not n_days:
+        return ""
+
+    dashboards: Dict[int, _DashboardTemplate] = getattr(_local, "dashboards", None)
+    if dashboards is None:
+        dashboards = _local.dashboards = {}
+    tpl = dashboards.get(n_days)
+    if tpl is None:
+        tpl = dashboards[n_days] = _DashboardTemplate(n_days)
+    tpl.update(metrics, snaps, scenario_id)
 
     os.makedirs(out_dir, exist_ok=True)
     path = os.path.join(out_dir, f"dashboard_{scenario_id}.png")
-    fig.savefig(path, dpi=130, bbox_inches="tight")
-    plt.close(fig)
+    tpl.fig.savefig(path, dpi=130, metadata={"Software": None}, pil_kwargs=_PNG_FAST)
     return path
 
 
@@ -380,11 +508,11 @@ def plot_comparison_chart(results: Dict[str, Tuple], out_dir: str) -> str:
     Returns the saved file path.
     """
     scen_ids  = list(results.keys())
-    labels    = [SCENARIOS[s]["label"] for s in scen_ids]
+    labels    = [SCENARIO_LABELS[s] for s in scen_ids]
     colors    = [SCENARIO_COLORS[s] for s in scen_ids]
 
     metrics_to_compare = [
-        ("avg_daily_m2",        "Avg Daily Production\n(units/day)",     None),
+        ("avg_daily_units",     "Avg Daily Production\n(units/day)",  None),
         ("fill_rate_pct",       "Order Fill Rate\n(%)",               95),
         ("otd_rate_pct",        "On-Time Delivery\n(%)",              95),
         ("total_breakdowns",    "Machine\nBreakdowns",                None),
@@ -392,12 +520,12 @@ def plot_comparison_chart(results: Dict[str, Tuple], out_dir: str) -> str:
         ("stockout_events",     "Stockout Events",                    None),
     ]
 
-    fig, axes = plt.subplots(2, 3, figsize=(14, 7))
+    fig  = _new_figure((14, 7))
+    axes = fig.subplots(2, 3)
     fig.suptitle(
         f"{FACTORY_NAME}  ·  90-Day Scenario Comparison",
         fontsize=12, fontweight="bold",
     )
-    plt.subplots_adjust(hspace=0.55, wspace=0.40)
 
     for idx, (key, title, target) in enumerate(metrics_to_compare):
         ax   = axes[idx // 3][idx % 3]
@@ -423,6 +551,5 @@ def plot_comparison_chart(results: Dict[str, Tuple], out_dir: str) -> str:
 
     os.makedirs(out_dir, exist_ok=True)
     path = os.path.join(out_dir, "scenario_comparison.png")
-    fig.savefig(path, dpi=130, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=130, metadata={"Software": None}, pil_kwargs=_PNG_FAST)
     return path
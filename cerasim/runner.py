@@ -0,0 +1,136 @@
+"""
+Scenario sweeps across worker processes.
+
+A single simulation is one sequential SimPy event loop, but the runs in a
+sweep (scenario × seed) share nothing, so they parallelise across processes
+(threads would serialise on the GIL).  Each worker builds its own
+environment and factory and sends back plain KPI / snapshot dicts; live
+SimPy objects never cross the process boundary.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from .config_arrays import CONFIG, ConfigBundle
+
+if TYPE_CHECKING:
+    from .metrics import MetricsCollector
+
+
+def _ticker(env, day_hr: float, tick: Callable[[], None]):
+    """SimPy process that calls *tick()* at the end of every simulated day."""
+    while True:
+        yield env.timeout(day_hr)
+        tick()
+
+
+def _run(scenario_id: str, seed: int, until: float, config: ConfigBundle,
+         tick: Optional[Callable[[], None]] = None):
+    """
+    Build, register and run one factory; returns it after ``env.run``.
+
+    The run is a single ``env.run`` call; progress reporting, if wanted,
+    rides along as a *tick* process instead of stepping the clock a day
+    at a time from outside.
+    """
+    # Imported here so a spawned worker unpickles only this module's
+    # functions before it starts building the simulation
+    import simpy
+    from .factory import CeramicFactory
+
+    env     = simpy.Environment()
+    factory = CeramicFactory(env, scenario=scenario_id, seed=seed, config=config)
+    factory.register_processes()
+    if tick is not None:
+        env.process(_ticker(env, config.hours_per_day, tick))
+    env.run(until=until)
+    return factory
+
+
+def simulate(scenario_id: str, seed: int = 42, config: ConfigBundle = CONFIG) -> dict:
+    """Run one full simulation of *scenario_id* and return its KPIs."""
+    factory = _run(scenario_id, seed, config.sim_duration, config)
+    return factory.metrics.compute_kpis(config.sim_days)
+
+
+def simulate_metrics(scenario_id: str, seed: int = 42, config: ConfigBundle = CONFIG,
+                     progress=None) -> Tuple["MetricsCollector", dict]:
+    """
+    Run one full simulation of *scenario_id*; returns ``(metrics, kpis)``.
+
+    The collector pickles without its environment, so this is the unit
+    of work when event logs (orders, batches, snapshots) are needed
+    back from a worker process, e.g. for the dashboards.  If *progress*
+    is given (a queue, e.g. from ``multiprocessing.Manager``), the run
+    puts *scenario_id* on it once per simulated day.
+    """
+    tick    = partial(progress.put, scenario_id) if progress is not None else None
+    factory = _run(scenario_id, seed, config.sim_duration, config, tick)
+    metrics = factory.metrics
+    return metrics, metrics.compute_kpis(config.sim_days)
+
+
+def run_one(args: Tuple[str, int, float]) -> dict:
+    """
+    One replication for ``executor.map``: *args* is ``(scenario_id, seed, until)``.
+
+    Returns a plain dict with the scenario, seed, KPIs and daily snapshots.
+    """
+    scenario_id, seed, until = args
+    factory = _run(scenario_id, seed, until, CONFIG)
+    metrics = factory.metrics
+    return {
+        "scenario":        scenario_id,
+        "seed":            seed,
+        "kpis":            metrics.compute_kpis(until / CONFIG.hours_per_day),
+        "daily_snapshots": metrics.daily_snapshots,
+    }
+
+
+def run_scenarios(
+    scenarios: Iterable[str],
+    seeds: Iterable[int] = (42,),
+    config: ConfigBundle = CONFIG,
+    max_workers: Optional[int] = None,
+) -> Dict[Tuple[str, int], dict]:
+    """
+    Simulate every (scenario, seed) pair in a process pool.
+
+    Returns ``{(scenario_id, seed): kpis}`` in submission order.
+    *max_workers* defaults to ``os.cpu_count()``.
+    """
+    seeds = list(seeds)
+    pairs = [(sid, seed) for sid in scenarios for seed in seeds]
+    if not pairs:
+        return {}
+
+    workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pair: pool.submit(simulate, *pair, config) for pair in pairs}
+        return {pair: fut.result() for pair, fut in futures.items()}
+
+
+def run_replications(
+    scenario_id: str,
+    n: int,
+    until: Optional[float] = None,
+    first_seed: int = 0,
+    max_workers: Optional[int] = None,
+) -> List[dict]:
+    """
+    Run *n* independent replications of *scenario_id* in a process pool.
+
+    Replication *i* uses seed ``first_seed + i`` and runs to *until* hours
+    (default: the full horizon).  Returns the ``run_one`` dicts in seed order.
+    """
+    if n <= 0:
+        return []
+    until   = CONFIG.sim_duration if until is None else until
+    workers = min(max_workers or os.cpu_count() or 1, n)
+    jobs    = [(scenario_id, first_seed + i, until) for i in range(n)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_one, jobs, chunksize=max(1, n // (4 * workers))))
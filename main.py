@@ -17,10 +17,10 @@ Usage
 
 import argparse
 import time
-from typing import Dict, Tuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing import Manager
+from typing import Dict, List, Tuple
 
-import simpy
-from rich.console import Console
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -30,9 +30,11 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from cerasim.config import SCENARIOS, SIM_DAYS, SIM_DURATION, HOURS_PER_DAY
-from cerasim.factory import CeramicFactory
+from cerasim.config import BATCH_SIZE_UNITS, MACHINES, SCENARIOS, SIM_DAYS
+from cerasim.config_arrays import BOTTLENECK, BOTTLENECK_IDX, STAGE_CAPACITY
+from cerasim.metrics import MetricsCollector
 from cerasim.reports import (
+    SCENARIO_LABELS,
     console,
     plot_comparison_chart,
     plot_scenario_dashboard,
@@ -40,38 +42,17 @@ from cerasim.reports import (
     print_comparison_table,
     print_kpi_table,
 )
+from cerasim.runner import simulate_metrics
 
 REPORT_DIR = "reports"
 
-
-# ─────────────────────────────────────────────────────────────────────────────
-# Simulation runner
-# ─────────────────────────────────────────────────────────────────────────────
-
-def run_scenario(
-    scenario_id: str,
-    seed: int = 42,
-    progress: Progress | None = None,
-    task_id=None,
-) -> Tuple[CeramicFactory, dict]:
-    """
-    Run one full 90-day simulation.
-
-    The simulation is advanced in 24-hour steps so we can update a progress
-    bar without multi-threading.
-    """
-    env     = simpy.Environment()
-    factory = CeramicFactory(env, scenario=scenario_id, seed=seed)
-    factory.register_processes()
-
-    step = HOURS_PER_DAY   # advance one simulated day at a time
-    for day in range(SIM_DAYS):
-        env.run(until=(day + 1) * step)
-        if progress and task_id is not None:
-            progress.advance(task_id, 1)
-
-    kpis = factory.metrics.compute_kpis(SIM_DAYS)
-    return factory, kpis
+# Progress-bar colour per scenario (Rich style names)
+SCENARIO_TASK_COLOR = {
+    "baseline":          "cyan",
+    "supply_disruption": "red",
+    "demand_surge":      "yellow",
+    "optimised":         "green",
+}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -91,7 +72,7 @@ def main() -> None:
     print_banner()
 
     scenario_ids = [args.scenario] if args.scenario else list(SCENARIOS.keys())
-    results: Dict[str, Tuple[CeramicFactory, dict]] = {}
+    results: Dict[str, Tuple[MetricsCollector, dict]] = {}
 
     # ── Run simulations with a progress bar ──────────────────────────────────
     console.print("[bold]Running simulations…[/bold]\n")
@@ -109,24 +90,31 @@ def main() -> None:
     ) as progress:
         tasks = {}
         for sid in scenario_ids:
-            label = SCENARIOS[sid]["label"]
-            colour = {
-                "baseline":          "cyan",
-                "supply_disruption": "red",
-                "demand_surge":      "yellow",
-                "optimised":         "green",
-            }.get(sid, "white")
+            label  = SCENARIO_LABELS[sid]
+            colour = SCENARIO_TASK_COLOR.get(sid, "white")
             tasks[sid] = progress.add_task(
                 f"[{colour}]{label:<22}[/{colour}]",
                 total=SIM_DAYS,
             )
 
-        for sid in scenario_ids:
-            factory, kpis = run_scenario(
-                sid, seed=args.seed,
-                progress=progress, task_id=tasks[sid],
-            )
-            results[sid] = (factory, kpis)
+        # Scenarios are independent runs, so each gets its own process;
+        # only the metrics collector and KPI dict come back.  Each run
+        # posts its scenario id on *ticks* once per simulated day.
+        with Manager() as manager, ProcessPoolExecutor(max_workers=len(scenario_ids)) as pool:
+            ticks   = manager.Queue()
+            futures = {pool.submit(simulate_metrics, sid, args.seed, progress=ticks): sid
+                       for sid in scenario_ids}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                while not ticks.empty():
+                    progress.advance(tasks[ticks.get()], 1)
+                for fut in done:
+                    sid = futures[fut]
+                    results[sid] = fut.result()
+                    # env.run(until=…) stops before the final midnight's tick
+                    progress.update(tasks[sid], completed=SIM_DAYS)
+        results = {sid: results[sid] for sid in scenario_ids}
 
     wall_elapsed = time.perf_counter() - wall_start
     console.print(
@@ -146,18 +134,18 @@ def main() -> None:
     # ── Generate Matplotlib dashboards ───────────────────────────────────────
     if not args.no_charts:
         console.print("[bold]Generating charts…[/bold]")
-        saved = []
-        for sid, (factory, kpis) in results.items():
-            path = plot_scenario_dashboard(factory, kpis, sid, REPORT_DIR)
-            if path:
-                saved.append(path)
-                console.print(f"  [green]✓[/green]  {path}")
-
-        if len(results) > 1:
-            path = plot_comparison_chart(results, REPORT_DIR)
-            if path:
-                saved.append(path)
-                console.print(f"  [green]✓[/green]  {path}")
+        # The dashboards render one after another on a single thread so
+        # they share that thread's reusable dashboard figure; the comparison
+        # chart is a separate figure and renders alongside them (Agg
+        # releases the GIL while rasterising and encoding)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            dashboards = pool.submit(_plot_dashboards, results)
+            comparison = (pool.submit(plot_comparison_chart, results, REPORT_DIR)
+                          if len(results) > 1 else None)
+            saved = dashboards.result() + ([comparison.result()] if comparison else [])
+        saved = [path for path in saved if path]
+        for path in saved:
+            console.print(f"  [green]✓[/green]  {path}")
 
         console.print()
 
@@ -165,6 +153,12 @@ def main() -> None:
     _print_insights(results)
 
 
+def _plot_dashboards(results: Dict[str, Tuple[MetricsCollector, dict]]) -> List[str]:
+    """Save every scenario's dashboard in turn; returns the paths."""
+    return [plot_scenario_dashboard(metrics, kpis, sid, REPORT_DIR)
+            for sid, (metrics, kpis) in results.items()]
+
+
 def _print_insights(results: Dict[str, Tuple]) -> None:
     """Print a short auto-generated insight block for stakeholders."""
     if "baseline" not in results:
@@ -176,10 +170,13 @@ def _print_insights(results: Dict[str, Tuple]) -> None:
     insights = []
 
     # Bottleneck
+    bn     = MACHINES[BOTTLENECK]
+    bn_cap = STAGE_CAPACITY[BOTTLENECK_IDX]
     insights.append(
-        "🔩  [bold]Tunnel kiln is the production bottleneck.[/bold]  "
-        "With 1 tunnel kiln at 24 h/batch, theoretical max throughput is "
-        "1 batch/day (50 units/day).  All upstream stages have spare capacity."
+        f"🔩  [bold]{bn['name']} is the production bottleneck.[/bold]  "
+        f"With {bn['count']} × {bn['proc_mean_hr']:g} h/batch, theoretical max throughput is "
+        f"{bn_cap:g} batch/day ({bn_cap * BATCH_SIZE_UNITS:,.0f} units/day).  "
+        "All other stages have spare capacity."
     )
 
     # Fill rate